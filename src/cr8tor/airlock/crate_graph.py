@@ -1,30 +1,47 @@
-from rdflib import Graph
+from functools import lru_cache
+from rdflib import Graph, Namespace
 from rdflib.query import Result
 import sys
 from pathlib import Path
 import cr8tor.airlock.schema as schemas
 
+CR8TOR = Namespace("https://lscsde.org/crate/")
+SCHEMA = Namespace("http://schema.org/")
+
+
+@lru_cache(maxsize=8)
+def _load_graph(metadata_path: str, mtime: float, base_uri: str) -> Graph:
+    """Parse the RO-Crate metadata file into a graph.
+
+    Cached on the file path and modification time so repeat loads of an unchanged
+    crate within the same process reuse the already parsed graph.
+    """
+    graph = Graph()
+
+    with open(metadata_path, "r", encoding="utf-8") as f:
+        ro_crate_jsonld = f.read()
+
+    graph.parse(data=ro_crate_jsonld, format="json-ld", publicID=base_uri)
+    print("\n=== DEBUG: RDF Triples ===")
+    for stmt in graph:
+        print(stmt)
+
+    return graph
+
 
 class ROCrateGraph:
     def __init__(
         self, rocrate_metadata_path: Path, base_uri="https://lscsde.org/crate/"
     ):
         """Load ROCrate graph"""
-        self.graph = Graph()
+        metadata_path = Path(rocrate_metadata_path).joinpath(
+            "data", "ro-crate-metadata.json"
+        ).resolve()
 
-        rocrate_metadata_path = Path(rocrate_metadata_path)
-
-        with open(
-            rocrate_metadata_path.joinpath("data", "ro-crate-metadata.json"),
-            "r",
-            encoding="utf-8",
-        ) as f:
-            ro_crate_jsonld = f.read()
-
-        self.graph.parse(data=ro_crate_jsonld, format="json-ld", publicID=base_uri)
-        print("\n=== DEBUG: RDF Triples ===")
-        for stmt in self.graph:
-            print(stmt)
+        self.graph = _load_graph(
+            str(metadata_path), metadata_path.stat().st_mtime, base_uri
+        )
+        self._action_status_index = None
 
     def run_query(self, sparql_query) -> Result:
         """Execute SPARQL query on the graph."""
@@ -38,20 +55,27 @@ class ROCrateGraph:
         project_id: str,
     ) -> bool:
         """Check if a project 'action' has completed successfully"""
+        statuses = self._get_action_status_index().get(
+            (CR8TOR[f"{command_type}-{project_id}"], SCHEMA[str(action_type)]), ()
+        )
+        return "CompletedActionStatus" in statuses
 
-        query = f"""
-          PREFIX schema: <http://schema.org/>
-          PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-          PREFIX cr8tor: <https://lscsde.org/crate/>
-          SELECT (IF(COUNT(*) > 0, 'True', 'False') AS ?result) WHERE {{
-            cr8tor:{command_type}-{project_id} rdf:type schema:{action_type} ;
-                    schema:actionStatus 'CompletedActionStatus' .
-          }}
-        """
-        result = self.run_query(query)
-        for row in result:
-            return str(row.result.value).strip().lower() == "true"
-        return False
+    def _get_action_status_index(self) -> dict:
+        """Index action statuses by (action id, action type), built on first use."""
+        if self._action_status_index is None:
+            query = """
+              PREFIX schema: <http://schema.org/>
+              PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+              SELECT ?action ?type ?status WHERE {
+                ?action rdf:type ?type ;
+                        schema:actionStatus ?status .
+              }
+            """
+            index = {}
+            for row in self.run_query(query):
+                index.setdefault((row.action, row.type), set()).add(str(row.status))
+            self._action_status_index = index
+        return self._action_status_index
 
     def get_validate_status(self) -> bool:
         """Get validation status of project"""
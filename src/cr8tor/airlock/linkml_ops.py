@@ -11,6 +11,15 @@ from pydantic import BaseModel, ValidationError
 
 from cr8tor.utils import log
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Buffer size for YAML writes, so the emitter's small writes are batched
+YAML_WRITE_BUFFER_SIZE = 1 << 16
+
 # Type variable for generic Pydantic model types
 T = TypeVar('T', bound=BaseModel)
 
@@ -32,7 +41,7 @@ def load_yaml_as_pydantic(yaml_path: Path, model_class: Type[T]) -> T:
     """
     try:
         with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
         
         if data is None:
             data = {}
@@ -76,8 +85,8 @@ def save_pydantic_as_yaml(
         mode='python'
     )
     
-    with open(yaml_path, 'w') as f:
-        yaml.safe_dump(data, f, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    with open(yaml_path, 'w', buffering=YAML_WRITE_BUFFER_SIZE, encoding='utf-8') as f:
+        yaml.dump(data, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
     
     log.info(
         f"[cyan]Saved model to YAML file:[/cyan] - [bold magenta]{yaml_path}[/bold magenta]"
@@ -96,7 +105,7 @@ def read_yaml_raw(yaml_path: Path) -> Dict[str, Any]:
     """
     try:
         with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
         return data if data is not None else {}
     
     except FileNotFoundError:
@@ -108,7 +117,7 @@ def read_yaml_raw(yaml_path: Path) -> Dict[str, Any]:
 
 def write_yaml_raw(yaml_path: Path, data: Dict[str, Any]) -> None:
     """
-    Write raw dictionary data to a YAML file using safe_dump for consistency.
+    Write raw dictionary data to a YAML file using the safe dumper for consistency.
     
     Args:
         yaml_path: Path where the YAML file should be saved
@@ -116,8 +125,8 @@ def write_yaml_raw(yaml_path: Path, data: Dict[str, Any]) -> None:
     """
     yaml_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(yaml_path, 'w') as f:
-        yaml.safe_dump(data, f, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    with open(yaml_path, 'w', buffering=YAML_WRITE_BUFFER_SIZE, encoding='utf-8') as f:
+        yaml.dump(data, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
     
     log.info(
         f"[cyan]Saved YAML file:[/cyan] - [bold magenta]{yaml_path}[/bold magenta]"
@@ -161,8 +170,8 @@ def update_yaml_field(
     current[keys[-1]] = value
     
     # Save back to file
-    with open(yaml_path, 'w') as f:
-        yaml.safe_dump(data, f, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    with open(yaml_path, 'w', buffering=YAML_WRITE_BUFFER_SIZE, encoding='utf-8') as f:
+        yaml.dump(data, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
     
     log.info(
         f"[cyan]Updated field '{field_path}' in:[/cyan] - [bold magenta]{yaml_path}[/bold magenta]"
@@ -243,6 +252,32 @@ def append_to_list_field(
     )
 
 
+def upsert_action(
+    raw_data: Dict[str, Any],
+    action_id: str,
+    action: Dict[str, Any]
+) -> None:
+    """
+    Replace the action with the given ID in project.actions, or append it if absent.
+    
+    Args:
+        raw_data: Raw governance data as returned by read_yaml_raw
+        action_id: ID of the action to replace
+        action: Serialised action to store
+    """
+    project = raw_data.setdefault('project', {})
+    actions = project.get('actions')
+    if actions is None:
+        actions = project['actions'] = []
+    
+    for i, existing in enumerate(actions):
+        if existing.get('id') == action_id:
+            actions[i] = action
+            return
+    
+    actions.append(action)
+
+
 def validate_yaml_against_model(yaml_path: Path, model_class: Type[T]) -> bool:
     """
     Validate a YAML file against a Pydantic model without loading it.
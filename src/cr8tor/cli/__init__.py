@@ -50,9 +50,20 @@ def generate_crds(
         str, typer.Option("-o", "--output", help="Output directory")
     ] = "crds/generated",
     force: Annotated[bool, typer.Option("--force", help="Force regeneration")] = False,
+    thorough_hash: Annotated[
+        bool,
+        typer.Option(
+            "--thorough-hash",
+            help="Detect model changes from full JSON schemas instead of model sources",
+        ),
+    ] = False,
     validate: Annotated[
         bool, typer.Option("--validate", help="Validate generated CRDs")
     ] = False,
+    deep: Annotated[
+        bool,
+        typer.Option("--deep", help="Fully parse generated CRDs when validating"),
+    ] = False,
 ):
     """Generate CRD YAML files from pydantic models."""
     import sys
@@ -63,13 +74,13 @@ def generate_crds(
         output_dir = Path(output)
         manager = KareCRDManager(output_dir=output_dir)
 
-        success = manager.generate_all_crds(force=force)
+        success = manager.generate_all_crds(force=force, thorough_hash=thorough_hash)
 
         if success:
             typer.echo(f"CRDs generated successfully in {output_dir}")
 
             if validate:
-                if manager.validate_generated_crds():
+                if manager.validate_generated_crds(deep=deep):
                     typer.echo("CRD validation passed")
                 else:
                     typer.echo("CRD validation failed")
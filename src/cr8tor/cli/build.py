@@ -6,7 +6,7 @@ import cr8tor.airlock.schema as s
 import cr8tor.airlock.resourceops as project_resources
 import cr8tor.airlock.linkml_ops as linkml_ops
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Optional
 from rocrate.rocrate import ROCrate
 
 from cr8tor.exception import DirectoryNotFoundError
@@ -84,6 +84,25 @@ def build(
     Example usage:
         cr8tor build -i path-to-resources-dir -c path-to-config-file --dryrun
     """
+    build_crate(resources_dir, config_file, dryrun)
+
+
+def build_crate(
+    resources_dir: Path,
+    config_file: Path = "./config.toml",
+    dryrun: bool = False,
+    governance_data: Optional[dict] = None,
+):
+    """
+    Builds the RO-Crate for the project resources and writes it to the bagit directory.
+
+    Args:
+        resources_dir (Path): Directory containing resources to include in the RO-Crate.
+        config_file (Path): Location of the configuration TOML file.
+        dryrun (bool): If True, the crate is not written to disk.
+        governance_data (dict, optional): Governance data already loaded by the caller.
+            When provided, the governance YAML is not re-read from disk.
+    """
     ###############################################################################
     # 1 Validate project build materials (i.e. resources/ & config.toml)
     ###############################################################################
@@ -97,7 +116,10 @@ def build(
 
     governance_path = resources_dir.joinpath("governance", "cr8-governance.yaml")
     try:
-        governance = linkml_ops.load_yaml_as_pydantic(governance_path, Governance)
+        if governance_data is not None:
+            governance = Governance(**governance_data)
+        else:
+            governance = linkml_ops.load_yaml_as_pydantic(governance_path, Governance)
     except Exception as e:
         raise ValueError(f"Error loading governance file: {str(e)}")
 
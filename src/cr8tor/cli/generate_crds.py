@@ -13,13 +13,15 @@ def generate_crds_command(args):
     manager = KareCRDManager(output_dir=output_dir)
 
     try:
-        success = manager.generate_all_crds(force=args.force)
+        success = manager.generate_all_crds(
+            force=args.force, thorough_hash=args.thorough_hash
+        )
 
         if success:
             print(f"CRDs generated successfully in {output_dir}")
 
             if args.validate:
-                if manager.validate_generated_crds():
+                if manager.validate_generated_crds(deep=args.deep):
                     print("CRD validation passed")
                 else:
                     print("CRD validation failed")
@@ -48,10 +50,22 @@ def add_generate_crds_parser(subparsers):
         help="Force regeneration even if models unchanged",
     )
 
+    parser.add_argument(
+        "--thorough-hash",
+        action="store_true",
+        help="Detect model changes from full JSON schemas instead of model sources",
+    )
+
     parser.add_argument(
         "--validate", action="store_true", help="Validate generated CRDs after creation"
     )
 
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Fully parse generated CRDs as YAML when validating",
+    )
+
     parser.set_defaults(func=generate_crds_command)
 
 
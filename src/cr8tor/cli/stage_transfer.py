@@ -4,6 +4,7 @@ import asyncio
 import uuid
 
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated
 from datetime import datetime
 
@@ -23,6 +24,12 @@ from cr8tor_metamodel.datamodel.cr8tor_metamodel_pydantic import (
 
 app = typer.Typer()
 
+# Defaults for required source fields not present in the ingress model
+_DEFAULT_PORT = 5432
+_EMPTY_CREDS = MappingProxyType(
+    {"provider": "", "password_key": "", "username_key": ""}
+)
+
 
 @app.command(name="stage-transfer")
 def stage_transfer(
@@ -150,7 +157,7 @@ def stage_transfer(
                     if hasattr(ingress.source, 'name') and ingress.source.name:
                         source_data["database"] = ingress.source.name
                     
-                    source_data["port"] = 5432  # Default port
+                    source_data["port"] = _DEFAULT_PORT
                     
                     if hasattr(ingress.source, 'credentials') and ingress.source.credentials:
                         source_data["credentials"] = {
@@ -159,11 +166,7 @@ def stage_transfer(
                             "username_key": ingress.source.credentials.username_key,
                         }
                     else:
-                        source_data["credentials"] = {
-                            "provider": "",
-                            "password_key": "",
-                            "username_key": "",
-                        }
+                        source_data["credentials"] = dict(_EMPTY_CREDS)
                 
                 # Build access contract for transfer
                 access_contract = schemas.DataContractTransferRequest(
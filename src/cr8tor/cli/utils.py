@@ -1,12 +1,11 @@
 import typer
-import yaml
 import cr8tor.airlock.schema as schemas
 import cr8tor.cli.build as ro_crate_builder
 import cr8tor.airlock.resourceops as project_resources
 import cr8tor.airlock.linkml_ops as linkml_ops
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Type, Union
 
 
 # Import LinkML Pydantic models for Actions
@@ -17,7 +16,8 @@ from cr8tor_metamodel.datamodel.cr8tor_metamodel_pydantic import (
 )
 
 
-def close_create_action_command(
+def _close_action(
+    action_cls: Type[Union[CreateAction, AssessAction]],
     command_type: schemas.Cr8torCommandType,
     start_time: datetime,
     project_id: str,
@@ -27,12 +27,13 @@ def close_create_action_command(
     exit_msg: str,
     exit_code: int,
     instrument: str,
-    result: Optional[list] = [],
+    additional_type: Optional[str] = None,
+    result: Optional[list] = None,
     dryrun: Optional[bool] = False,
     config_file: Optional[Path] = "./config.toml",
 ):
     """
-    CreateAction - updated to work with LinkML YAML resources
+    Record the closing action in the governance resource, rebuild the crate and exit
     """
 
     if exit_code == schemas.Cr8torReturnCode.SUCCESS:
@@ -42,56 +43,79 @@ def close_create_action_command(
         status_type = ActionStatusType.FailedActionStatus
         err = exit_msg
 
-    action_props = CreateAction(
-        id=f"{command_type}-{project_id}",
-        action_type="CreateAction",
+    result = result or ()
+    action_id = f"{command_type}-{project_id}"
+    end_time = datetime.now()
+
+    extra_props = {"additional_type": additional_type} if additional_type else {}
+    action_props = action_cls(
+        id=action_id,
+        action_type=action_cls.__name__,
         name=f"{command_type} Data Project Action",
         start_time=start_time,
-        end_time=datetime.now(),
+        end_time=end_time,
         action_status=status_type,
         agent=agent,
         error=err,
         instrument=instrument,
-        result=[str(r.get("@id", r)) if isinstance(r, dict) else str(r) for r in result] if result else [],
+        result=[str(r.get("@id", r)) if type(r) is dict else str(r) for r in result],
+        **extra_props,
     )
 
-    # Delete existing action with same ID, then append the new one
+    #
+    # This assumes commands can be run multiple times on a project
+    # Ensures previous run entities for this action are cleared in "actions" before
+    # actions is updated with the new action entity
+    #
+
+    action_data = action_props.model_dump(mode='json', exclude_none=True)
+
+    # Replace any existing action with the same ID, otherwise append it.
     # Using raw YAML operations since we're working with the actions list
-    try:
-        raw_data = linkml_ops.read_yaml_raw(governance_path)
-        
-        # Initialize project.actions if it doesn't exist
-        if 'project' not in raw_data:
-            raw_data['project'] = {}
-        if 'actions' not in raw_data['project']:
-            raw_data['project']['actions'] = []
-        
-        # Remove any existing action with the same ID
-        raw_data['project']['actions'] = [
-            action for action in raw_data['project']['actions']
-            if action.get('id') != f"{command_type}-{project_id}"
-        ]
-        
-        # Append the new action
-        raw_data['project']['actions'].append(action_props.model_dump(mode='json', exclude_none=True))
-        
-        # Save updated data
-        
-        with open(governance_path, 'w') as f:
-            yaml.dump(raw_data, f, sort_keys=False, default_flow_style=False, allow_unicode=True)
-            
-    except Exception as e:
-        # Fall back to simple append if there's an error
-        linkml_ops.append_to_list_field(
-            governance_path,
-            "project.actions",
-            action_props.model_dump(mode='json', exclude_none=True)
-        )
+    raw_data = linkml_ops.read_yaml_raw(governance_path)
+    linkml_ops.upsert_action(raw_data, action_id, action_data)
+    linkml_ops.write_yaml_raw(governance_path, raw_data)
 
-    ro_crate_builder.build(resources_dir, config_file, dryrun)
+    ro_crate_builder.build_crate(
+        resources_dir, config_file, dryrun, governance_data=raw_data
+    )
     exit_command(command_type, exit_code, exit_msg)
 
 
+def close_create_action_command(
+    command_type: schemas.Cr8torCommandType,
+    start_time: datetime,
+    project_id: str,
+    agent: str,
+    governance_path: Path,
+    resources_dir: Path,
+    exit_msg: str,
+    exit_code: int,
+    instrument: str,
+    result: Optional[list] = None,
+    dryrun: Optional[bool] = False,
+    config_file: Optional[Path] = "./config.toml",
+):
+    """
+    CreateAction - updated to work with LinkML YAML resources
+    """
+    _close_action(
+        CreateAction,
+        command_type=command_type,
+        start_time=start_time,
+        project_id=project_id,
+        agent=agent,
+        governance_path=governance_path,
+        resources_dir=resources_dir,
+        exit_msg=exit_msg,
+        exit_code=exit_code,
+        instrument=instrument,
+        result=result,
+        dryrun=dryrun,
+        config_file=config_file,
+    )
+
+
 def close_assess_action_command(
     command_type: schemas.Cr8torCommandType,
     start_time: datetime,
@@ -103,73 +127,26 @@ def close_assess_action_command(
     exit_code: int,
     instrument: str,
     additional_type: Optional[str] = None,
-    result: Optional[list] = [],
+    result: Optional[list] = None,
 ):
     """
     AssessAction
     """
-
-    if exit_code == schemas.Cr8torReturnCode.SUCCESS:
-        status_type = ActionStatusType.CompletedActionStatus
-        err = None
-    else:
-        status_type = ActionStatusType.FailedActionStatus
-        err = exit_msg
-
-    action_props = AssessAction(
-        id=f"{command_type}-{project_id}",
-        action_type="AssessAction",
-        name=f"{command_type} Data Project Action",
+    _close_action(
+        AssessAction,
+        command_type=command_type,
         start_time=start_time,
-        end_time=datetime.now(),
-        action_status=status_type,
+        project_id=project_id,
         agent=agent,
-        error=err,
+        governance_path=governance_path,
+        resources_dir=resources_dir,
+        exit_msg=exit_msg,
+        exit_code=exit_code,
         instrument=instrument,
         additional_type=additional_type,
-        result=[str(r.get("@id", r)) if isinstance(r, dict) else str(r) for r in result] if result else [],
+        result=result,
     )
 
-    #
-    # This assumes validate can be run multiple times on a project
-    # Ensures previous run entities for this action are cleared in "actions" before
-    # actions is updated with the new action entity
-    #
-
-    # Delete existing action with same ID, then append the new one
-    # Using raw YAML operations since we're working with the actions list
-    try:
-        raw_data = linkml_ops.read_yaml_raw(governance_path)
-        
-        # Initialize project.actions if it doesn't exist
-        if 'project' not in raw_data:
-            raw_data['project'] = {}
-        if 'actions' not in raw_data['project']:
-            raw_data['project']['actions'] = []
-        
-        # Remove any existing action with the same ID
-        raw_data['project']['actions'] = [
-            action for action in raw_data['project']['actions']
-            if action.get('id') != f"{command_type}-{project_id}"
-        ]
-        
-        # Append the new action
-        raw_data['project']['actions'].append(action_props.model_dump(mode='json', exclude_none=True))
-        
-        # Save updated data using centralized write function
-        linkml_ops.write_yaml_raw(governance_path, raw_data)
-            
-    except Exception as e:
-        # Fall back to simple append if there's an error
-        linkml_ops.append_to_list_field(
-            governance_path,
-            "project.actions",
-            action_props.model_dump(mode='json', exclude_none=True)
-        )
-
-    ro_crate_builder.build(resources_dir)
-    exit_command(command_type, exit_code, exit_msg)
-
 
 def exit_command(
     command_type: schemas.Cr8torCommandType, exit_code: int, exit_msg: str
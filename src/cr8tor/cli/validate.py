@@ -24,13 +24,14 @@ from cr8tor_metamodel.datamodel.cr8tor_metamodel_pydantic import (
 app = typer.Typer()
 
 
-def merge_metadata_into_dataset(
-    ingress_path: Path, dataset_name: str, metadata: schemas.DatasetMetadata
-) -> None:
-    """Merge validated metadata into the ingress YAML file for a specific dataset."""
-    # Load the ingress YAML as Pydantic model
-    ingress = linkml_ops.load_yaml_as_pydantic(ingress_path, Ingress)
-    
+def merge_metadata_into_dataset_model(
+    ingress: Ingress, dataset_name: str, metadata: schemas.DatasetMetadata
+) -> bool:
+    """Merge validated metadata into a specific dataset of an in-memory ingress model.
+
+    Returns True if the dataset was found and updated, False otherwise.
+    The caller is responsible for saving the ingress model.
+    """
     # Find the dataset by name
     target_dataset = None
     if ingress.datasets:
@@ -41,7 +42,7 @@ def merge_metadata_into_dataset(
     
     if not target_dataset:
         # Dataset not found, skip merge
-        return
+        return False
     
     # Initialize tables if not present
     if not target_dataset.tables:
@@ -61,36 +62,46 @@ def merge_metadata_into_dataset(
                 existing_table.description = meta_table.description
             
             existing_col_lookup = {col.name: col for col in existing_table.columns}
-            
-            for meta_col in meta_table.columns or []:
-                if meta_col.name not in existing_col_lookup:
-                    # Add new column
-                    new_col = Column(
-                        name=meta_col.name,
-                        datatype=meta_col.datatype or "string",
-                    )
-                    existing_table.columns.append(new_col)
-                else:
-                    # Update existing column if fields are missing
-                    existing_col = existing_col_lookup[meta_col.name]
-                    if meta_col.description and not existing_col.description:
-                        existing_col.description = meta_col.description
-                    if meta_col.datatype and not existing_col.datatype:
-                        existing_col.datatype = meta_col.datatype
+            meta_columns = meta_table.columns or []
+
+            # Update existing columns if fields are missing
+            for meta_col in meta_columns:
+                existing_col = existing_col_lookup.get(meta_col.name)
+                if existing_col is None:
+                    continue
+                if meta_col.description and not existing_col.description:
+                    existing_col.description = meta_col.description
+                if meta_col.datatype and not existing_col.datatype:
+                    existing_col.datatype = meta_col.datatype
+
+            # Add new columns in one batch. Metadata was already validated as
+            # schemas.DatasetMetadata, so skip re-validation.
+            existing_table.columns.extend(
+                Column.model_construct(
+                    name=meta_col.name,
+                    datatype=meta_col.datatype or "string",
+                    description=meta_col.description,
+                )
+                for meta_col in meta_columns
+                if meta_col.name not in existing_col_lookup
+            )
         else:
-            # Add new table
+            # Add new table. Metadata was already validated as
+            # schemas.DatasetMetadata, so skip re-validation.
             new_columns = []
             if meta_table.columns:
                 for col in meta_table.columns:
                     new_columns.append(
-                        Column(
+                        Column.model_construct(
                             name=col.name,
                             datatype=col.datatype or "string",
+                            description=col.description,
                         )
                     )
 
-            new_table = Table(
+            new_table = Table.model_construct(
                 name=meta_table.name,
+                description=meta_table.description,
                 columns=new_columns if new_columns else None
             )
             target_dataset.tables.append(new_table)
@@ -98,9 +109,8 @@ def merge_metadata_into_dataset(
     # Update dataset description if provided
     if metadata.description and not target_dataset.description:
         target_dataset.description = metadata.description
-    
-    # Save the updated ingress model back to YAML
-    linkml_ops.save_pydantic_as_yaml(ingress_path, ingress)
+
+    return True
 
 
 def verify_tables_metadata(
@@ -108,31 +118,68 @@ def verify_tables_metadata(
     local_metadata: Optional[List[Table]],
 ) -> Tuple[bool, Optional[str]]:
     """Verify that local table metadata matches remote schema."""
+    if local_metadata is None:
+        return True, None
+
     remote_lookup = {
-        table.name: {col.name for col in table.columns} for table in remote_metadata
+        table.name: frozenset(col.name for col in table.columns or ())
+        for table in remote_metadata
     }
 
-    if local_metadata is not None:
-        for local_table in local_metadata:
-            table_name = local_table.name
-            if table_name not in remote_lookup:
+    for local_table in local_metadata:
+        table_name = local_table.name
+        remote_table_columns = remote_lookup.get(table_name)
+        if remote_table_columns is None:
+            return (
+                False,
+                f"Validation Error: Table '{table_name}' is missing from target schema metadata.",
+            )
+
+        if local_table.columns is None:
+            continue
+
+        for filter_col in local_table.columns:
+            if filter_col.name not in remote_table_columns:
                 return (
                     False,
-                    f"Validation Error: Table '{table_name}' is missing from target schema metadata.",
+                    f"Validation Error: Column '{filter_col.name}' is missing from target schema table '{table_name}' metadata.",
                 )
 
-            remote_table_columns = remote_lookup[table_name]
-            if local_table.columns is None:
-                continue
+    return True, None
+
 
-            for filter_col in local_table.columns:
-                if filter_col.name not in remote_table_columns:
-                    return (
-                        False,
-                        f"Validation Error: Column '{filter_col.name}' is missing from target schema table '{table_name}' metadata.",
+def _dataset_to_metadata(dataset: Dataset) -> schemas.DatasetMetadata:
+    """Convert a LinkML Dataset to the API schema format."""
+    return schemas.DatasetMetadata(
+        name=dataset.name,
+        schema_name=dataset.schema_name,
+        description=dataset.description,
+        tables=[
+            schemas.TableMetadata(
+                name=table.name,
+                description=table.description,
+                columns=[
+                    schemas.ColumnMetadata(
+                        name=col.name,
+                        datatype=col.datatype,
+                        description=col.description or None,
                     )
+                    for col in table.columns or []
+                ],
+            )
+            for table in dataset.tables or []
+        ],
+    )
 
-    return True, None
+
+async def _validate_datasets_access(
+    access_contracts: List[schemas.DataContractValidateRequest],
+) -> list:
+    """Validate access for all datasets concurrently, returning results in request order."""
+    return await asyncio.gather(
+        *(api.validate_access(contract) for contract in access_contracts),
+        return_exceptions=True,
+    )
 
 
 @app.command(name="validate")
@@ -173,8 +220,8 @@ def validate(
         cr8tor validate -b <path-to-bagit-dir> -i <path-to-resources-dir>
     """
 
-    if agent is None:
-        agent = os.getenv("AGENT_USER")
+    agent = agent or os.getenv("AGENT_USER")
+    metadata_name = os.getenv("METADATA_NAME")
 
     exit_msg = "Validation complete"
     exit_code = schemas.Cr8torReturnCode.SUCCESS
@@ -209,109 +256,119 @@ def validate(
             resources_dir=resources_dir,
             exit_msg="The create command must be run on the target project before validation",
             exit_code=schemas.Cr8torReturnCode.ACTION_WORKFLOW_ERROR,
-            instrument=os.getenv("METADATA_NAME"),
+            instrument=metadata_name,
         )
 
-    # Validate each dataset in the ingress configuration
-    if ingress.datasets:
-        for dataset in ingress.datasets:
-            try:
-                # Build the validation request from LinkML models
-                # Convert LinkML Dataset to old schema format for API compatibility
-                dataset_meta_dict = {
-                    "name": dataset.name,
-                    "schema_name": dataset.schema_name,
-                    "description": dataset.description if hasattr(dataset, 'description') else None,
-                    "tables": [],
-                }
-                
-                if dataset.tables:
-                    for table in dataset.tables:
-                        table_dict = {
-                            "name": table.name,
-                            "description": table.description if hasattr(table, 'description') else None,
-                            "columns": [],
-                        }
-                        if table.columns:
-                            for col in table.columns:
-                                col_dict = {
-                                    "name": col.name,
-                                    "datatype": col.datatype,
-                                }
-                                if hasattr(col, 'description') and col.description:
-                                    col_dict["description"] = col.description
-                                table_dict["columns"].append(col_dict)
-                        dataset_meta_dict["tables"].append(table_dict)
-                
-                # Build source data from ingress model
-                source_data = {}
-                if ingress.source:
-                    # Add required fields for discriminated union
-                    if hasattr(ingress.source, 'type') and ingress.source.type:
-                        source_data["type"] = ingress.source.type
-                    if hasattr(ingress.source, 'url') and ingress.source.url:
-                        source_data["host_url"] = ingress.source.url  # Map url to host_url for compatibility
-                    if hasattr(ingress.source, 'name') and ingress.source.name:
-                        source_data["database"] = ingress.source.name  # Map name to database for SQL sources
-                    
-                    # Add default port if not specified (required field)
-                    source_data["port"] = 5432  # Default PostgreSQL port, adjust based on type if needed
-                    
-                    # Add credentials if present
-                    if hasattr(ingress.source, 'credentials') and ingress.source.credentials:
-                        source_data["credentials"] = {
-                            "provider": ingress.source.credentials.provider,
-                            "password_key": ingress.source.credentials.password_key,
-                            "username_key": ingress.source.credentials.username_key,
-                        }
-                    else:
-                        # Provide default empty credentials if not present (required field)
-                        source_data["credentials"] = {
-                            "provider": "",
-                            "password_key": "",
-                            "username_key": "",
-                        }
-                
-                # Build access contract for validation
-                access_contract = schemas.DataContractValidateRequest(
-                    project_name=project_info.name,
-                    project_start_time=project_info.start_time if project_info.start_time else datetime.now().isoformat(),
-                    destination={
-                        "type": ingress.destination.type if hasattr(ingress.destination.type, 'value') else str(ingress.destination.type),
-                        "url": ingress.destination.url if ingress.destination.url else "",
-                    },
-                    source=source_data if source_data else {},
-                    extract_config=None,
-                    dataset=schemas.DatasetMetadata(**dataset_meta_dict),
-                )
-                
-                metadata = asyncio.run(api.validate_access(access_contract))
-
-
-                validate_dataset_info = schemas.DatasetMetadata(**metadata)
-
-            except Exception as e:
-                cli_utils.close_assess_action_command(
-                    command_type=schemas.Cr8torCommandType.VALIDATE,
-                    start_time=start_time,
-                    project_id=project_id,
-                    agent=agent,
-                    governance_path=governance_path,
-                    resources_dir=resources_dir,
-                    exit_msg=f"{str(e)}",
-                    exit_code=schemas.Cr8torReturnCode.UNKNOWN_ERROR,
-                    instrument=os.getenv("METADATA_NAME"),
-                )
+    # Source, destination and start time are shared by every dataset request
+    source_data = {}
+    if ingress.source:
+        # Add required fields for discriminated union
+        if getattr(ingress.source, 'type', None):
+            source_data["type"] = ingress.source.type
+        if getattr(ingress.source, 'url', None):
+            source_data["host_url"] = ingress.source.url  # Map url to host_url for compatibility
+        if getattr(ingress.source, 'name', None):
+            source_data["database"] = ingress.source.name  # Map name to database for SQL sources
+
+        # Add default port if not specified (required field)
+        source_data["port"] = 5432  # Default PostgreSQL port, adjust based on type if needed
+
+        # Add credentials if present
+        if getattr(ingress.source, 'credentials', None):
+            source_data["credentials"] = {
+                "provider": ingress.source.credentials.provider,
+                "password_key": ingress.source.credentials.password_key,
+                "username_key": ingress.source.credentials.username_key,
+            }
+        else:
+            # Provide default empty credentials if not present (required field)
+            source_data["credentials"] = {
+                "provider": "",
+                "password_key": "",
+                "username_key": "",
+            }
+
+    destination = {
+        "type": ingress.destination.type if hasattr(ingress.destination.type, 'value') else str(ingress.destination.type),
+        "url": ingress.destination.url if ingress.destination.url else "",
+    }
+    project_start_time = project_info.start_time if project_info.start_time else datetime.now().isoformat()
+
+    # Build the validation request for each dataset in the ingress configuration
+    datasets = ingress.datasets or []
+    access_contracts = []
+    for dataset in datasets:
+        try:
+            # Build access contract for validation
+            access_contracts.append(schemas.DataContractValidateRequest(
+                project_name=project_info.name,
+                project_start_time=project_start_time,
+                destination=destination,
+                source=source_data,
+                extract_config=None,
+                dataset=_dataset_to_metadata(dataset),
+            ))
 
-            is_valid, err = verify_tables_metadata(
-                validate_dataset_info.tables, dataset.tables
+        except Exception as e:
+            cli_utils.close_assess_action_command(
+                command_type=schemas.Cr8torCommandType.VALIDATE,
+                start_time=start_time,
+                project_id=project_id,
+                agent=agent,
+                governance_path=governance_path,
+                resources_dir=resources_dir,
+                exit_msg=f"{str(e)}",
+                exit_code=schemas.Cr8torReturnCode.UNKNOWN_ERROR,
+                instrument=metadata_name,
             )
-            if not is_valid:
-                exit_msg = err
-                exit_code = schemas.Cr8torReturnCode.VALIDATION_ERROR
-                break
 
-            merge_metadata_into_dataset(ingress_path, dataset.name, validate_dataset_info)
+    # Validate access for all datasets concurrently
+    access_results = (
+        asyncio.run(_validate_datasets_access(access_contracts))
+        if access_contracts
+        else []
+    )
+
+    # Verify and merge results in dataset order.
+    # Merged metadata is accumulated on the in-memory ingress model and saved once.
+    ingress_modified = False
+    for dataset, metadata in zip(datasets, access_results):
+        try:
+            if isinstance(metadata, BaseException):
+                raise metadata
+            validate_dataset_info = schemas.DatasetMetadata(**metadata)
+
+        except Exception as e:
+            if ingress_modified:
+                linkml_ops.save_pydantic_as_yaml(ingress_path, ingress)
+            cli_utils.close_assess_action_command(
+                command_type=schemas.Cr8torCommandType.VALIDATE,
+                start_time=start_time,
+                project_id=project_id,
+                agent=agent,
+                governance_path=governance_path,
+                resources_dir=resources_dir,
+                exit_msg=f"{str(e)}",
+                exit_code=schemas.Cr8torReturnCode.UNKNOWN_ERROR,
+                instrument=metadata_name,
+            )
+
+        is_valid, err = verify_tables_metadata(
+            validate_dataset_info.tables, dataset.tables
+        )
+        if not is_valid:
+            exit_msg = err
+            exit_code = schemas.Cr8torReturnCode.VALIDATION_ERROR
+            break
+
+        if merge_metadata_into_dataset_model(
+            ingress, dataset.name, validate_dataset_info
+        ):
+            ingress_modified = True
+
+    if ingress_modified:
+        linkml_ops.save_pydantic_as_yaml(ingress_path, ingress)
+
     #
     # This assumes validate can be run multiple times on a project
     # Ensures previous run entities for this action are cleared in "actions" before
@@ -327,6 +384,6 @@ def validate(
         resources_dir=resources_dir,
         exit_msg=exit_msg,
         exit_code=exit_code,
-        instrument=os.getenv("METADATA_NAME"),
+        instrument=metadata_name,
         additional_type="Semantic Validation",
     )
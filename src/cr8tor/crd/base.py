@@ -1,6 +1,6 @@
 """Base classes for CRD specifications."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, List
 from datetime import datetime
 
@@ -31,13 +31,10 @@ class CRDStatus(BaseModel):
     conditions: List[CRDCondition] = Field(default_factory=list)
     observedGeneration: Optional[int] = None
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class CRDSpec(BaseModel):
     """Base class for all CRD spec objects."""
 
-    class Config:
-        extra = "forbid"
-        validate_assignment = True
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
@@ -1,27 +1,138 @@
 """GitOps CRD management and generation system."""
 
 import hashlib
+import inspect
 import json
 import logging
+import os
+import sys
+import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import yaml
+from typing import Iterable
 
 from .registry import CRDRegistry
 
 logger = logging.getLogger(__name__)
 
 
+def _get_yaml():
+    """Import PyYAML on first use; it is only needed for deep CRD validation."""
+    import yaml
+
+    return yaml
+
+
+def _serialize_crd(crd_def):
+    """Serialise a CRD definition as YAML with a fixed header and a JSON spec.
+
+    JSON is valid YAML, so the spec is emitted with json.dumps instead of the
+    general-purpose YAML emitter. Continuation lines are indented under the
+    spec key; JSON strings never contain raw newlines.
+    """
+    spec = json.dumps(crd_def["spec"], indent=2).replace("\n", "\n  ")
+    return (
+        f"apiVersion: {crd_def['apiVersion']}\n"
+        f"kind: {crd_def['kind']}\n"
+        "metadata:\n"
+        f"  name: {json.dumps(crd_def['metadata']['name'])}\n"
+        f"spec: {spec}\n"
+    )
+
+
+def _annotation_classes(annotation):
+    """Yield the classes referenced by a field annotation, including generic arguments."""
+    if isinstance(annotation, type):
+        yield annotation
+    for arg in typing.get_args(annotation):
+        yield from _annotation_classes(arg)
+
+
+def _model_classes(model_class):
+    """Collect a model, its bases and the classes of its nested field types.
+
+    Standard library and pydantic classes are left out; their schema output is
+    covered by the pydantic version in the digest.
+    """
+    classes = set()
+    seen = set()
+    stack = [model_class]
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        for base in cls.__mro__:
+            package = base.__module__.partition(".")[0]
+            if package not in sys.stdlib_module_names and package != "pydantic":
+                classes.add(base)
+        for field in getattr(cls, "model_fields", {}).values():
+            stack.extend(_annotation_classes(field.annotation))
+    return classes
+
+
+CRD_API_VERSION = "apiextensions.k8s.io/v1"
+CRD_KIND = "CustomResourceDefinition"
+
+# Generated CRD files start with their top-level keys, so a quick validation
+# only needs to inspect the first few hundred bytes of each file
+_CRD_REQUIRED_FIELDS = ("apiVersion", "kind", "metadata", "spec")
+_CRD_HEADER_BYTES = 512
+_CRD_HEADER_MARKERS = tuple(f"\n{field}:".encode() for field in _CRD_REQUIRED_FIELDS)
+_CRD_KIND_LINE = f"\nkind: {CRD_KIND}\n".encode()
+
+# Status subresource schema shared by all generated CRDs. It is never modified
+# after construction, so every CRD definition references the same object.
+_STATUS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "phase": {"type": "string"},
+        "conditions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "type": {"type": "string"},
+                    "status": {"type": "string"},
+                    "reason": {"type": "string"},
+                    "message": {"type": "string"},
+                    "lastTransitionTime": {
+                        "type": "string",
+                        "format": "date-time",
+                    },
+                },
+                "required": [
+                    "type",
+                    "status",
+                    "reason",
+                    "message",
+                ],
+            },
+        },
+        "observedGeneration": {"type": "integer"},
+    },
+    "additionalProperties": True,
+}
+
+
 class OpenAPIConverter:
     """Convert pydantic schemas to OpenAPI v3 compatible schemas for CRDs."""
 
-    @staticmethod
-    def convert_schema(pydantic_schema):
+    def __init__(self):
+        self._defs = {}
+        self._ref_cache = {}
+
+    def convert_schema(self, pydantic_schema):
         """Convert pydantic JSON schema to OpenAPI v3 schema for Kubernetes CRDs."""
+        # $defs names are only unique within a single schema
+        self._defs = pydantic_schema.get("$defs", {})
+        self._ref_cache = {}
+
         openapi_schema = {"type": "object", "properties": {}}
 
         if "properties" in pydantic_schema:
-            openapi_schema["properties"] = OpenAPIConverter._convert_properties(
-                pydantic_schema["properties"], pydantic_schema.get("$defs", {})
+            openapi_schema["properties"] = self._convert_properties(
+                pydantic_schema["properties"]
             )
 
         if "required" in pydantic_schema:
@@ -29,28 +140,29 @@ class OpenAPIConverter:
 
         return openapi_schema
 
-    @staticmethod
-    def _convert_properties(properties, property_defs):
+    def _convert_properties(self, properties):
         """Convert properties recursively."""
-        converted = {}
-
-        for prop_name, prop_schema in properties.items():
-            converted[prop_name] = OpenAPIConverter._convert_property(
-                prop_schema, property_defs
-            )
-
-        return converted
+        convert = self._convert_property
+        return {
+            prop_name: convert(prop_schema)
+            for prop_name, prop_schema in properties.items()
+        }
 
-    @staticmethod
-    def _convert_property(prop_schema, defs):
+    def _convert_property(self, prop_schema):
         """Convert a single property schema."""
         # Handle $ref (references to definitions)
         if "$ref" in prop_schema:
             ref_path = prop_schema["$ref"]
             if ref_path.startswith("#/$defs/"):
                 def_name = ref_path.replace("#/$defs/", "")
-                if def_name in defs:
-                    return OpenAPIConverter._convert_property(defs[def_name], defs)
+                if def_name in self._defs:
+                    cached = self._ref_cache.get(def_name)
+                    if cached is None:
+                        cached = self._ref_cache[def_name] = self._convert_property(
+                            self._defs[def_name]
+                        )
+                    # Shared between every reference to the definition, so it is read-only
+                    return cached
 
         # Handle anyOf (Optional fields)
         if "anyOf" in prop_schema:
@@ -65,8 +177,10 @@ class OpenAPIConverter:
                     result["description"] = prop_schema["description"]
                 return result
             for option in non_null:
-                result = OpenAPIConverter._convert_property(option, defs)
+                result = self._convert_property(option)
                 if "description" in prop_schema and "description" not in result:
+                    # Shallow copy: the converted node may be a shared $ref definition
+                    result = dict(result)
                     result["description"] = prop_schema["description"]
                 # A string field mentioned as json data should be stored as a yaml object in the CRD
                 if result.get("type") == "string" and "JSON" in result.get("description", ""):
@@ -79,17 +193,17 @@ class OpenAPIConverter:
             # If all options are null, treat as string
             return {"type": "string"}
 
+        prop_type = prop_schema.get("type")
+
         # Handle arrays
-        if prop_schema.get("type") == "array":
+        if prop_type == "array":
             converted = {"type": "array"}
             if "items" in prop_schema:
-                converted["items"] = OpenAPIConverter._convert_property(
-                    prop_schema["items"], defs
-                )
+                converted["items"] = self._convert_property(prop_schema["items"])
             return converted
 
         # Handle objects
-        if prop_schema.get("type") == "object":
+        if prop_type == "object":
             if not prop_schema.get("properties"):
                 return {
                     "type": "object",
@@ -98,8 +212,8 @@ class OpenAPIConverter:
 
             # For objects with defined properties, use standard validation
             converted = {"type": "object"}
-            converted["properties"] = OpenAPIConverter._convert_properties(
-                prop_schema["properties"], defs
+            converted["properties"] = self._convert_properties(
+                prop_schema["properties"]
             )
             if "required" in prop_schema:
                 converted["required"] = prop_schema["required"]
@@ -110,7 +224,7 @@ class OpenAPIConverter:
         # Handle basic types
         result = {}
         if "type" in prop_schema:
-            result["type"] = prop_schema["type"]
+            result["type"] = prop_type
         if "description" in prop_schema:
             result["description"] = prop_schema["description"]
         if "default" in prop_schema:
@@ -133,9 +247,37 @@ class KareCRDManager:
         self.output_dir = output_dir or Path("crds/generated")
         self.registry = CRDRegistry()
         self.converter = OpenAPIConverter()
+        self._schema_cache = {}
+        self._openapi_cache = {}
+        self._crd_def_cache = {}
+
+    def _schema_for(self, model_key, model_class):
+        """Return the pydantic JSON schema for a model, generating it once per key."""
+        schema = self._schema_cache.get(model_key)
+        if schema is None:
+            schema = self._schema_cache[model_key] = model_class.model_json_schema()
+        return schema
+
+    def _openapi_schema_for(self, model_key, schema):
+        """Return the OpenAPI spec schema for a model, converting it once per key."""
+        openapi_schema = self._openapi_cache.get(model_key)
+        if openapi_schema is None:
+            openapi_schema = self._openapi_cache[model_key] = (
+                self.converter.convert_schema(schema)
+            )
+        return openapi_schema
+
+    def generate_all_crds(self, force=False, thorough_hash=False):
+        """Generate CRDs for models that changed since the last run.
 
-    def generate_all_crds(self, force=False):
-        """Generate CRDs only if models changed.
+        Per-model digests are stored in .models_hashes.json; only CRDs whose
+        model digest changed (or whose file is missing) are rewritten, and files
+        for models that are no longer registered are removed.
+
+        Args:
+            force: Regenerate every CRD even if its model is unchanged
+            thorough_hash: Detect changes from the full model JSON schemas instead
+                of the source of the model classes
 
         Returns:
             bool: True if CRDs were generated/updated, False if no changes needed
@@ -143,79 +285,149 @@ class KareCRDManager:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Re-read model schemas on every generation run
+        self._schema_cache.clear()
+        self._openapi_cache.clear()
+        self._crd_def_cache.clear()
+
         # Discover all models
         self.registry.discover_models()
-        # Check if models have changed
-        current_hash = self._calculate_models_hash()
-        hash_file = self.output_dir / ".models_hash"
-
-        if not force and hash_file.exists():
-            stored_hash = hash_file.read_text().strip()
-            if stored_hash == current_hash:
-                logger.info("CRD models unchanged, skipping generation")
-                return False
-
-        logger.info("Generating CRDs from pydantic models...")
-
-        # Generate CRDs
         models = self.registry.get_all_models()
         if not models:
             logger.warning("No CRD models found to generate")
             return False
 
-        generated_files = []
-
-        for model_key, model_info in models.items():
+        # Check which models have changed
+        current_digests = self._calculate_model_digests(models, thorough=thorough_hash)
+        hashes_file = self.output_dir / ".models_hashes.json"
+        stored = {}
+        if hashes_file.exists():
             try:
-                crd_def = self._generate_crd_definition(model_info)
-                filename = f"{crd_def['metadata']['name']}.yaml"
-                file_path = self.output_dir / filename
-
-                with open(file_path, "w") as f:
-                    yaml.dump(crd_def, f, default_flow_style=False, sort_keys=False)
+                stored = json.loads(hashes_file.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable {hashes_file}: {e}")
+            else:
+                # Entries are {model_key: {"digest": ..., "file": ...}}; anything else is regenerated
+                if not isinstance(stored, dict) or not all(
+                    isinstance(entry, dict) for entry in stored.values()
+                ):
+                    logger.warning(f"Ignoring {hashes_file} in an unexpected format")
+                    stored = {}
+
+        filenames = {
+            model_key: f"{model_info['crd_name']}.yaml"
+            for model_key, model_info in models.items()
+        }
+        changed = [
+            model_key
+            for model_key in models
+            if force
+            or current_digests[model_key] is None
+            or stored.get(model_key, {}).get("digest") != current_digests[model_key]
+            or not (self.output_dir / filenames[model_key]).exists()
+        ]
+        removed = [model_key for model_key in stored if model_key not in models]
+
+        if not changed and not removed:
+            logger.info("CRD models unchanged, skipping generation")
+            return False
 
-                generated_files.append(filename)
-                logger.info(f"Generated CRD: {filename}")
+        logger.info(f"Generating {len(changed)} CRDs from pydantic models...")
 
+        # Build changed CRD definitions first, then write the files concurrently
+        crd_defs = []
+        for model_key in changed:
+            try:
+                crd_def = self._generate_crd_definition(models[model_key])
             except Exception as e:
                 logger.error(f"Failed to generate CRD for {model_key}: {e}")
                 raise
+            crd_defs.append((filenames[model_key], crd_def))
 
-        # Generate kustomization.yaml
-        self._generate_kustomization(generated_files)
+        if crd_defs:
+            with ThreadPoolExecutor(max_workers=min(32, len(crd_defs))) as executor:
+                list(executor.map(self._write_crd_file, crd_defs))
 
-        # Update hash file
-        hash_file.write_text(current_hash)
+        # Remove files for models that are no longer registered
+        current_files = set(filenames.values())
+        for model_key in removed:
+            orphan = stored[model_key].get("file")
+            if orphan and orphan not in current_files:
+                (self.output_dir / orphan).unlink(missing_ok=True)
+                logger.info(f"Removed CRD: {orphan}")
+
+        # Generate kustomization.yaml
+        self._generate_kustomization(filenames.values())
+
+        # Update hashes file
+        hashes_file.write_text(
+            json.dumps(
+                {
+                    model_key: {"digest": current_digests[model_key], "file": filenames[model_key]}
+                    for model_key in sorted(models)
+                },
+                indent=2,
+            )
+        )
+        # Superseded by the per-model hashes file
+        (self.output_dir / ".models_hash").unlink(missing_ok=True)
 
-        logger.info(f"Generated {len(generated_files)} CRD files")
+        logger.info(f"Generated {len(crd_defs)} CRD files")
         return True
 
+    def _write_crd_file(self, crd_file):
+        """Write a single CRD definition to the output directory, replacing it atomically."""
+        filename, crd_def = crd_file
+        file_path = self.output_dir / filename
+        tmp_path = file_path.with_name(f".{filename}.tmp")
+
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(_serialize_crd(crd_def))
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            logger.error(f"Failed to write CRD {filename}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Generated CRD: {filename}")
+        return filename
+
     def _generate_crd_definition(self, model_info):
-        """Generate a single CRD definition from model info."""
+        """Generate a single CRD definition from model info.
+
+        Definitions are cached per model and shared between callers, so they
+        must be treated as read-only.
+        """
         model_class = model_info["model"]
         group = model_info["group"]
         version = model_info["version"]
         kind = model_info["kind"]
-        plural = model_info["plural"]
-        singular = model_info["singular"]
         scope = model_info["scope"]
 
+        model_key = f"{group}/{version}/{kind}"
+
         # Get pydantic schema
         try:
-            schema = model_class.model_json_schema()
+            schema = self._schema_for(model_key, model_class)
         except Exception as e:
             raise ValueError(
                 f"Failed to generate schema for {model_class.__name__}: {e}"
             )
 
+        # Reuse the definition built from this exact schema, if any
+        cached = self._crd_def_cache.get(model_key)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
         # Convert to OpenAPI schema
-        openapi_schema = self.converter.convert_schema(schema)
+        openapi_schema = self._openapi_schema_for(model_key, schema)
 
         # Create full CRD structure
         crd = {
-            "apiVersion": "apiextensions.k8s.io/v1",
-            "kind": "CustomResourceDefinition",
-            "metadata": {"name": f"{plural}.{group}"},
+            "apiVersion": CRD_API_VERSION,
+            "kind": CRD_KIND,
+            "metadata": {"name": model_info["crd_name"]},
             "spec": {
                 "group": group,
                 "versions": [
@@ -228,36 +440,7 @@ class KareCRDManager:
                                 "type": "object",
                                 "properties": {
                                     "spec": openapi_schema,
-                                    "status": {
-                                        "type": "object",
-                                        "properties": {
-                                            "phase": {"type": "string"},
-                                            "conditions": {
-                                                "type": "array",
-                                                "items": {
-                                                    "type": "object",
-                                                    "properties": {
-                                                        "type": {"type": "string"},
-                                                        "status": {"type": "string"},
-                                                        "reason": {"type": "string"},
-                                                        "message": {"type": "string"},
-                                                        "lastTransitionTime": {
-                                                            "type": "string",
-                                                            "format": "date-time",
-                                                        },
-                                                    },
-                                                    "required": [
-                                                        "type",
-                                                        "status",
-                                                        "reason",
-                                                        "message",
-                                                    ],
-                                                },
-                                            },
-                                            "observedGeneration": {"type": "integer"},
-                                        },
-                                        "additionalProperties": True,
-                                    },
+                                    "status": _STATUS_SCHEMA,
                                 },
                                 "required": ["spec"],
                             }
@@ -266,57 +449,102 @@ class KareCRDManager:
                     }
                 ],
                 "scope": scope,
-                "names": {
-                    "plural": plural,
-                    "singular": singular,
-                    "kind": kind,
-                    "shortNames": [singular[:3]],
-                },
+                "names": model_info["names"],
             },
         }
 
+        self._crd_def_cache[model_key] = (schema, crd)
         return crd
 
-    def _generate_kustomization(self, filenames):
-        """Generate kustomization.yaml for all CRDs."""
-        kustomization = {
-            "apiVersion": "kustomize.config.k8s.io/v1beta1",
-            "kind": "Kustomization",
-            "resources": sorted(filenames),
-        }
+    def _generate_kustomization(self, filenames: Iterable[str]):
+        """Generate kustomization.yaml for all CRDs.
+
+        Args:
+            filenames: CRD file names; duplicates are listed once
+        """
+        resources = "".join(f"- {filename}\n" for filename in sorted(set(filenames)))
 
         kustomization_path = self.output_dir / "kustomization.yaml"
         with open(kustomization_path, "w") as f:
-            yaml.dump(kustomization, f, default_flow_style=False)
+            f.write(
+                "apiVersion: kustomize.config.k8s.io/v1beta1\n"
+                "kind: Kustomization\n"
+                f"resources:\n{resources}"
+            )
 
         logger.info("Generated kustomization.yaml")
 
-    def _calculate_models_hash(self):
-        """Calculate hash of all model definitions for change detection."""
-        # Discover models first
-        self.registry.discover_models()
-        models = self.registry.get_all_models()
+    def _calculate_model_digests(self, models, thorough=False):
+        """Calculate a digest per model definition for change detection.
 
-        # Create representation
-        model_data = {}
-        for model_key, model_info in sorted(models.items()):
+        By default a digest covers the model's registration metadata, the
+        pydantic version and the qualified name and source of the model, its
+        bases and its nested field types, which avoids generating JSON schemas
+        for unchanged models. Schema inputs defined outside those classes, such
+        as shared constants or type aliases, are only seen with thorough=True,
+        which hashes the full JSON schema instead. Models whose schema cannot be
+        generated get a None digest.
+        """
+        import pydantic
+
+        digests = {}
+        class_digests = {}
+        for model_key, model_info in models.items():
             model_class = model_info["model"]
-            try:
-                schema = model_class.model_json_schema()
-                model_data[model_key] = {
-                    "schema": schema,
+            if not thorough:
+                # Schema output can change with pydantic itself
+                model_hash = hashlib.sha256(pydantic.VERSION.encode())
+                model_entry = {
+                    "key": model_key,
+                    "model": f"{model_class.__module__}.{model_class.__qualname__}",
                     "group": model_info["group"],
                     "version": model_info["version"],
                     "kind": model_info["kind"],
+                    "plural": model_info["plural"],
                     "scope": model_info["scope"],
                 }
+                model_hash.update(
+                    json.dumps(model_entry, sort_keys=True, separators=(",", ":")).encode()
+                )
+                try:
+                    model_classes = sorted(
+                        _model_classes(model_class), key=lambda c: (c.__module__, c.__qualname__)
+                    )
+                    for cls in model_classes:
+                        digest = class_digests.get(cls)
+                        if digest is None:
+                            # getsource reads through linecache, so each file is read once
+                            digest = class_digests[cls] = hashlib.sha256(
+                                f"{cls.__module__}.{cls.__qualname__}\n{inspect.getsource(cls)}".encode()
+                            ).digest()
+                        model_hash.update(digest)
+                except (OSError, TypeError):
+                    # getsource raises these for classes without source, e.g. ones built at runtime
+                    logger.info(f"No class source for {model_key}, hashing its schema instead")
+                else:
+                    digests[model_key] = f"v2:{model_hash.hexdigest()}"
+                    continue
+
+            try:
+                schema = self._schema_for(model_key, model_class)
             except Exception as e:
                 logger.warning(f"Could not generate schema for {model_key}: {e}")
+                digests[model_key] = None
                 continue
 
-        # Calculate hash
-        model_json = json.dumps(model_data, sort_keys=True)
-        return hashlib.sha256(model_json.encode()).hexdigest()
+            model_entry = {
+                "key": model_key,
+                "schema": schema,
+                "group": model_info["group"],
+                "version": model_info["version"],
+                "kind": model_info["kind"],
+                "scope": model_info["scope"],
+            }
+            digests[model_key] = "v2-schema:" + hashlib.sha256(
+                json.dumps(model_entry, sort_keys=True, separators=(",", ":")).encode()
+            ).hexdigest()
+
+        return digests
 
     def apply_crds_to_cluster(self, memory_only: bool = True) -> bool:
         """Apply CRDs directly to Kubernetes cluster (for runtime operation).
@@ -344,36 +572,23 @@ class KareCRDManager:
                 logger.warning("No CRD models found for in-memory generation")
                 return False
 
-            applied_count = 0
+            # Build definitions first, then apply them concurrently
+            crd_defs = []
             for model_key, model_info in models.items():
                 try:
-                    crd_def = self._generate_crd_definition(model_info)
-                    crd_name = crd_def["metadata"]["name"]
-
-                    # Try to get existing CRD
-                    try:
-                        existing = api_client.read_custom_resource_definition(crd_name)
-                        # Update existing CRD
-                        crd_def["metadata"]["resourceVersion"] = (
-                            existing.metadata.resource_version
-                        )
-                        api_client.replace_custom_resource_definition(
-                            name=crd_name, body=crd_def
-                        )
-                        logger.info(f"Updated CRD in-memory: {crd_name}")
-                    except client.exceptions.ApiException as e:
-                        if e.status == 404:
-                            # Create new CRD
-                            api_client.create_custom_resource_definition(body=crd_def)
-                            logger.info(f"Created CRD in-memory: {crd_name}")
-                        else:
-                            raise
-
-                    applied_count += 1
-
+                    crd_defs.append((model_key, self._generate_crd_definition(model_info)))
                 except Exception as e:
                     logger.error(f"Failed to apply CRD {model_key}: {e}")
 
+            applied_count = 0
+            if crd_defs:
+                with ThreadPoolExecutor(max_workers=min(16, len(crd_defs))) as executor:
+                    applied_count = sum(
+                        executor.map(
+                            lambda item: self._apply_crd(api_client, *item), crd_defs
+                        )
+                    )
+
             logger.info(
                 f"Applied {applied_count} CRDs to cluster (memory-only: {memory_only})"
             )
@@ -383,6 +598,40 @@ class KareCRDManager:
             logger.error(f"Failed to apply CRDs to cluster: {e}")
             return False
 
+    def _apply_crd(self, api_client, model_key, crd_def):
+        """Create or replace a single CRD in the cluster, returning True on success."""
+        from kubernetes.client.exceptions import ApiException
+
+        try:
+            crd_name = crd_def["metadata"]["name"]
+            # Copy the metadata so the cached definition is left unchanged
+            crd_def = {**crd_def, "metadata": dict(crd_def["metadata"])}
+
+            # Try to get existing CRD
+            try:
+                existing = api_client.read_custom_resource_definition(crd_name)
+                # Update existing CRD
+                crd_def["metadata"]["resourceVersion"] = (
+                    existing.metadata.resource_version
+                )
+                api_client.replace_custom_resource_definition(
+                    name=crd_name, body=crd_def
+                )
+                logger.info(f"Updated CRD in-memory: {crd_name}")
+            except ApiException as e:
+                if e.status == 404:
+                    # Create new CRD
+                    api_client.create_custom_resource_definition(body=crd_def)
+                    logger.info(f"Created CRD in-memory: {crd_name}")
+                else:
+                    raise
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to apply CRD {model_key}: {e}")
+            return False
+
     def get_crds_as_dict(self):
         """Generate all CRDs as in-memory dictionary objects.
 
@@ -403,8 +652,12 @@ class KareCRDManager:
 
         return crds
 
-    def validate_generated_crds(self):
-        """Validate that generated CRDs are valid Kubernetes resources."""
+    def validate_generated_crds(self, deep=False):
+        """Validate that generated CRDs are valid Kubernetes resources.
+
+        Args:
+            deep: Parse each file as YAML instead of only checking its header
+        """
         if not self.output_dir.exists():
             logger.error("CRD output directory does not exist")
             return False
@@ -420,20 +673,30 @@ class KareCRDManager:
         valid_count = 0
         for crd_file in crd_files:
             try:
-                with open(crd_file, "r") as f:
-                    crd_def = yaml.safe_load(f)
-
-                # Basic validation
-                if not isinstance(crd_def, dict):
-                    logger.error(f"Invalid YAML in {crd_file}")
-                    continue
-
-                required_fields = ["apiVersion", "kind", "metadata", "spec"]
-                if not all(field in crd_def for field in required_fields):
+                if deep:
+                    yaml = _get_yaml()
+                    with open(crd_file, "r") as f:
+                        crd_def = yaml.safe_load(f)
+
+                    # Basic validation
+                    if not isinstance(crd_def, dict):
+                        logger.error(f"Invalid YAML in {crd_file}")
+                        continue
+
+                    has_fields = all(field in crd_def for field in _CRD_REQUIRED_FIELDS)
+                    is_crd = crd_def.get("kind") == CRD_KIND
+                else:
+                    with open(crd_file, "rb") as f:
+                        header = b"\n" + f.read(_CRD_HEADER_BYTES)
+
+                    has_fields = all(marker in header for marker in _CRD_HEADER_MARKERS)
+                    is_crd = _CRD_KIND_LINE in header
+
+                if not has_fields:
                     logger.error(f"Missing required fields in {crd_file}")
                     continue
 
-                if crd_def["kind"] != "CustomResourceDefinition":
+                if not is_crd:
                     logger.error(f"Not a CRD: {crd_file}")
                     continue
 
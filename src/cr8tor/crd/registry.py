@@ -3,6 +3,7 @@
 import importlib
 import pkgutil
 import logging
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -11,20 +12,16 @@ class CRDRegistry:
     """Global registry forCRD models with auto-discovery."""
 
     _instance = None
-    _initialised = False
 
     def __new__(cls):
+        # State is set up once here; there is no __init__ to re-run per access
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._models = {}
-            cls._instance._initialised = False
+            cls._instance._models_view = MappingProxyType(cls._instance._models)
+            cls._instance._discovered_packages = set()
         return cls._instance
 
-    def __init__(self):
-        if not self._initialised:
-            self._models = {}
-            self._initialised = True
-
     @classmethod
     def register(cls, group, version, kind, plural=None, scope="Namespaced"):
         """Decorator to register CRD models.
@@ -53,6 +50,7 @@ class CRDRegistry:
             # Register in singleton instance
             registry_instance = cls()
             key = f"{group}/{version}/{kind}"
+            singular = kind.lower()
 
             registry_instance._models[key] = {
                 "model": model_class,
@@ -61,7 +59,15 @@ class CRDRegistry:
                 "kind": kind,
                 "plural": model_class._crd_plural,
                 "scope": scope,
-                "singular": kind.lower(),
+                "singular": singular,
+                # Precomputed CRD fields, shared read-only by every generated definition
+                "crd_name": f"{model_class._crd_plural}.{group}",
+                "names": {
+                    "plural": model_class._crd_plural,
+                    "singular": singular,
+                    "kind": kind,
+                    "shortNames": [singular[:3]],
+                },
             }
 
             logger.debug(f"Registered CRD: {key}")
@@ -69,28 +75,38 @@ class CRDRegistry:
 
         return decorator
 
-    def discover_models(self, package_paths=None):
+    def discover_models(self, package_paths=None, force_rediscover=False):
         """Auto-discover all CRD models in specified packages.
 
+        Packages are only imported once per process unless force_rediscover is set.
+
         Args:
             package_paths: List of package paths to search (e.g., ['cr8tor.models'])
+            force_rediscover: Re-import packages that were already discovered
         """
         if package_paths is None:
             package_paths = ["cr8tor.models"]
 
         for package_path in package_paths:
+            if package_path in self._discovered_packages and not force_rediscover:
+                continue
             try:
-                self._discover_in_package(package_path)
+                if self._discover_in_package(package_path):
+                    self._discovered_packages.add(package_path)
             except ImportError as e:
                 logger.warning(f"Could not discover models in {package_path}: {e}")
 
     def _discover_in_package(self, package_path):
-        """Recursively discover models in a package."""
+        """Recursively discover models in a package.
+
+        Returns:
+            bool: True if the package was found and its submodules imported
+        """
         try:
             package = importlib.import_module(package_path)
         except ImportError:
             logger.warning(f"Package {package_path} not found")
-            return
+            return False
 
         # Import all submodules
         if hasattr(package, "__path__"):
@@ -102,9 +118,11 @@ class CRDRegistry:
                 except ImportError as e:
                     logger.warning(f"Could not import {full_module_name}: {e}")
 
+        return True
+
     def get_all_models(self):
-        """Get all registered CRD models."""
-        return self._models.copy()
+        """Get a read-only, live view of all registered CRD models."""
+        return self._models_view
 
     def get_model_by_key(self, group, version, kind):
         """Get a specific CRD model by its key."""
@@ -126,6 +144,7 @@ class CRDRegistry:
     def clear_registry(self):
         """Clear all registered models (useful for testing)."""
         self._models.clear()
+        self._discovered_packages.clear()
 
     def validate_model_schema(self, model_class):
         """Validate that a model can be converted to OpenAPI schema."""
@@ -1,12 +1,19 @@
 """Module that provides the identity handler for the operator."""
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
+import threading
+import time
 
 import kopf
 import kubernetes
 from kubernetes.client.exceptions import ApiException
 
+from cr8tor.services.kube_client import get_api_client
 from cr8tor.services.user_manager import sync_keycloak_user, delete_keycloak_user
 from cr8tor.services.group_manager import sync_keycloak_group, delete_keycloak_group
 from cr8tor.services.client_manager import sync_keycloak_client, delete_keycloak_client
@@ -26,7 +33,7 @@ from cr8tor.services.storage_manager import (
     ensure_workspace_pvc,
     delete_workspace_pvc,
     get_pvc_name,
-    get_project_uid,
+    get_project_crd,
     resolve_notebook_storage_config,
     resolve_project_storage_config,
     ensure_project_pvc,
@@ -37,31 +44,179 @@ logger = logging.getLogger(__name__)
 # Namespace where User and Group CRDs are stored
 IDENTITY_NAMESPACE = os.environ.get("IDENTITY_NAMESPACE", "keycloak")
 
+# Maximum concurrent notebook PVC provisioning calls per reconciliation
+PVC_CONCURRENCY = int(os.environ.get("PVC_CONCURRENCY", "8"))
 
-def _get_user_uid(username):
+# Maximum in-flight Keycloak calls across all concurrent reconciles
+KEYCLOAK_CONCURRENCY = int(os.environ.get("KEYCLOAK_CONCURRENCY", "16"))
+_keycloak_semaphore = asyncio.Semaphore(KEYCLOAK_CONCURRENCY)
+
+
+async def _keycloak_call(func, *args, **kwargs):
+    """Run a blocking Keycloak call in a thread, bounded by KEYCLOAK_CONCURRENCY.
+
+    Args:
+        func: Keycloak service function
+        *args, **kwargs: Arguments for func
+    """
+    async with _keycloak_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+# Seconds a successful realm check is trusted before Keycloak is asked again
+REALM_CHECK_TTL = int(os.environ.get("REALM_CHECK_TTL", "300"))
+_realm_checked_at = None
+_realm_lock = threading.Lock()
+
+
+def _ensure_realm_once():
+    """Ensure the Keycloak realm exists, at most once per REALM_CHECK_TTL.
+
+    Failures are not cached, so the next reconciliation checks again.
+    """
+    global _realm_checked_at
+    with _realm_lock:
+        now = time.monotonic()
+        if _realm_checked_at is not None and now - _realm_checked_at < REALM_CHECK_TTL:
+            return
+        _realm_checked_at = None
+        ensure_realm_exists()
+        _realm_checked_at = now
+
+
+# Annotation holding the hash of the last spec that reconciled without errors
+SPEC_HASH_ANNOTATION = "karectl.io/spec-hash"
+
+
+def _spec_hash(spec):
+    """Hash a CRD spec independently of key order.
+
+    Args:
+        spec: CRD spec
+    """
+    payload = json.dumps(dict(spec), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _spec_unchanged(reason, spec, meta):
+    """Check whether an update event carries the spec that was last reconciled successfully.
+
+    Create and resume events always reconcile, so drift is still repaired on operator restart.
+
+    Args:
+        reason: kopf handler reason ("create", "update", "resume")
+        spec: CRD spec
+        meta: CRD metadata
+    """
+    if reason != "update":
+        return False
+    return (meta.get("annotations") or {}).get(SPEC_HASH_ANNOTATION) == _spec_hash(spec)
+
+
+def _record_spec_hash(patch, spec, succeeded):
+    """Store the spec hash after a clean reconcile, or clear it so the next update reconciles.
+
+    Args:
+        patch: kopf patch object
+        spec: CRD spec
+        succeeded: Whether the reconcile finished without errors
+    """
+    patch.metadata.setdefault("annotations", {})[SPEC_HASH_ANNOTATION] = (
+        _spec_hash(spec) if succeeded else None
+    )
+
+
+def _get_cached_identity_object(plural, name):
+    """GET an identity CRD from the apiserver watch cache rather than a quorum read from etcd.
+
+    CustomObjectsApi does not expose resourceVersion for GETs, so the request is made
+    through the ApiClient directly.
+
+    Args:
+        plural: CRD plural ("users" or "groups")
+        name: CRD resource name
+    """
+    return get_api_client().call_api(
+        "/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}",
+        "GET",
+        path_params={
+            "group": "identity.karectl.io",
+            "version": "v1alpha1",
+            "namespace": IDENTITY_NAMESPACE,
+            "plural": plural,
+            "name": name,
+        },
+        query_params=[("resourceVersion", "0")],
+        header_params={"Accept": "application/json"},
+        response_type="object",
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True,
+    )
+
+
+@kopf.index("identity.karectl.io", "v1alpha1", "group")
+def group_projects_by_member(spec, namespace, **kwargs):
+    """Index the projects of each Group CRD by member username."""
+    if namespace != IDENTITY_NAMESPACE:
+        return {}
+    projects = list(spec.get("projects", []))
+    return {member: projects for member in spec.get("members", [])}
+
+
+@kopf.index("identity.karectl.io", "v1alpha1", "user")
+def usernames_by_group(spec, namespace, **kwargs):
+    """Index User CRD usernames by the groups listed in their spec."""
+    username = spec.get("username")
+    if namespace != IDENTITY_NAMESPACE or not username:
+        return {}
+    return {group_name: username for group_name in spec.get("groups", [])}
+
+
+@kopf.index("identity.karectl.io", "v1alpha1", "user")
+def user_uids(name, namespace, uid, **kwargs):
+    """Index User CRD metadata.uid by resource name."""
+    if namespace != IDENTITY_NAMESPACE:
+        return {}
+    return {name: uid}
+
+
+@kopf.index("research.karectl.io", "v1alpha1", "project")
+def project_crds(name, namespace, uid, spec, **kwargs):
+    """Index the uid and spec of each Project CRD by resource name."""
+    if namespace != IDENTITY_NAMESPACE:
+        return {}
+    return {name: {"metadata": {"uid": uid}, "spec": dict(spec)}}
+
+
+def _get_user_uid(username, user_uids=None):
     """Get the metadata.uid of a User CRD.
 
     Args:
         username: username (CRD resource name)
+        user_uids: Optional kopf index of User CRD UIDs (fetched from API if not provided)
     """
-    api = kubernetes.client.CustomObjectsApi()
-    user = api.get_namespaced_custom_object(
-        group="identity.karectl.io",
-        version="v1alpha1",
-        plural="users",
-        namespace=IDENTITY_NAMESPACE,
-        name=username,
-    )
+    if user_uids is not None:
+        for uid in user_uids.get(username, []):
+            return uid
+    user = _get_cached_identity_object("users", username)
     return user["metadata"]["uid"]
 
 
-def get_user_projects(username):
+def get_user_projects(username, group_projects_by_member=None):
     """ Resolve all projects the user has access to by scanning Group CRDs for membership.
 
     Args:
         username: The username to look up across all Group CRD members lists.
+        group_projects_by_member: Optional kopf index of group projects by member
+            (Group CRDs are listed from the API if not provided)
     """
-    api = kubernetes.client.CustomObjectsApi()
+    if group_projects_by_member is not None:
+        return {
+            project
+            for group_projects in group_projects_by_member.get(username, [])
+            for project in group_projects
+        }
+
+    api = kubernetes.client.CustomObjectsApi(get_api_client())
     projects = set()
 
     try:
@@ -70,6 +225,8 @@ def get_user_projects(username):
             version="v1alpha1",
             namespace=IDENTITY_NAMESPACE,
             plural="groups",
+            resource_version="0",
+            resource_version_match="NotOlderThan",
         )
         for group_cr in all_groups.get("items", []):
             members = group_cr.get("spec", {}).get("members", [])
@@ -84,28 +241,29 @@ def get_user_projects(username):
     return projects
 
 
-def get_group_members(group_name):
+def get_group_members(group_name, spec=None, usernames_by_group=None):
     """Get all members of a group from group CRD.
 
     Args:
         group_name: Name of the group
+        spec: Optional Group CRD spec (fetched from API if not provided)
+        usernames_by_group: Optional kopf index of usernames by group
+            (User CRDs are listed from the API if not provided)
     """
-    api = kubernetes.client.CustomObjectsApi()
+    api = kubernetes.client.CustomObjectsApi(get_api_client())
 
     # Check for Group CRD's members field
-    try:
-        group_cr = api.get_namespaced_custom_object(
-            group="identity.karectl.io",
-            version="v1alpha1",
-            namespace=IDENTITY_NAMESPACE,
-            plural="groups",
-            name=group_name,
-        )
-        members = group_cr.get("spec", {}).get("members", [])
-        if members:
-            return members
-    except ApiException:
-        pass
+    if spec is None:
+        try:
+            spec = _get_cached_identity_object("groups", group_name).get("spec", {})
+        except ApiException:
+            spec = {}
+    members = spec.get("members", [])
+    if members:
+        return members
+
+    if usernames_by_group is not None:
+        return list(usernames_by_group.get(group_name, []))
 
     # If N/A, get users who got this group in their groups list
     members = []
@@ -115,6 +273,8 @@ def get_group_members(group_name):
             version="v1alpha1",
             namespace=IDENTITY_NAMESPACE,
             plural="users",
+            resource_version="0",
+            resource_version_match="NotOlderThan",
         )
         for user in users.get("items", []):
             user_groups = user.get("spec", {}).get("groups", [])
@@ -128,141 +288,216 @@ def get_group_members(group_name):
     return members
 
 
-def ensure_user_notebook_pvc(username, projects, user_uid):
-    """Ensure notebook PVCs exist for a user in the projects.
+def _resolve_project_notebook_storage(project_name, project_crds=None):
+    """Resolve the per-project values needed for notebook PVCs.
+
+    Returns (namespace, project_uid, size, storage_class); project_uid is None if the
+    Project CRD does not exist.
+
+    Args:
+        project_name: project name (CRD resource name)
+        project_crds: Optional kopf index of Project CRDs (fetched from API if not provided
+            or the project is missing from it)
+    """
+    project = None
+    if project_crds is not None:
+        project = next(iter(project_crds.get(project_name, [])), None)
+    if project is None:
+        # Not in the index yet, e.g. a Group and Project applied together, so read it live
+        try:
+            project = get_project_crd(project_name)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            project = None
+
+    size, storage_class = resolve_notebook_storage_config(
+        project_name, spec=(project or {}).get("spec", {})
+    )
+    project_uid = project["metadata"]["uid"] if project else None
+    return get_proj_namespace(project_name), project_uid, size, storage_class
+
+
+def _ensure_project_notebook_pvc(username, project_name, project_storage, user_uid):
+    """Ensure the notebook PVC exists for a user in one project.
 
     Args:
         username: username
-        projects: Set/list of project names
+        project_name: project name
+        project_storage: Result of _resolve_project_notebook_storage for the project
         user_uid: k8s metadata.uid of the User CRD
     """
-    results = {}
-    project_uid_cache = {}
+    namespace, project_uid, size, storage_class = project_storage
+
+    if size is None:
+        logger.info(f"No notebook storage configured for project {project_name}, skipping PVC for {username}")
+        return {"status": "skipped", "reason": "no_storage_config"}
+
+    if project_uid is None:
+        logger.warning(f"Project CRD {project_name} not found, skipping PVC for {username}")
+        return {"status": "skipped", "reason": "project_crd_not_found"}
+    pvc_name = get_pvc_name("notebook", user_uid, project_uid)
+    labels = {
+        "karectl.io/user": username,
+        "karectl.io/project": project_name,
+        "karectl.io/workspace-type": "notebook",
+        "karectl.io/provisioned-by": "identity-handler",
+    }
+
+    # Create PVC
+    result = ensure_workspace_pvc(
+        namespace=namespace,
+        pvc_name=pvc_name,
+        size=size,
+        storage_class=storage_class,
+        labels=labels,
+    )
 
-    for project_name in projects:
-        try:
-            # Check for project namespace
-            namespace = get_proj_namespace(project_name)
+    logger.info(f"Notebook PVC for {username} in {project_name}: {result['status']} ({pvc_name})")
+    return result
 
-            # Resolve storage config for this project
-            size, storage_class = resolve_notebook_storage_config(project_name)
 
-            if size is None:
-                logger.info(f"No notebook storage configured for project {project_name}, skipping PVC for {username}")
-                results[project_name] = {"status": "skipped", "reason": "no_storage_config"}
-                continue
+async def ensure_user_notebook_pvc(
+    username, projects, user_uid, project_cache=None, semaphore=None, project_crds=None
+):
+    """Ensure notebook PVCs exist for a user in the projects.
 
-            if project_name not in project_uid_cache:
-                try:
-                    project_uid_cache[project_name] = get_project_uid(project_name)
-                except ApiException as e:
-                    if e.status == 404:
-                        logger.warning(f"Project CRD {project_name} not found, skipping PVC for {username}")
-                        results[project_name] = {"status": "skipped", "reason": "project_crd_not_found"}
-                        continue
-                    raise
-            project_uid = project_uid_cache[project_name]
-            pvc_name = get_pvc_name("notebook", user_uid, project_uid)
-            labels = {
-                "karectl.io/user": username,
-                "karectl.io/project": project_name,
-                "karectl.io/workspace-type": "notebook",
-                "karectl.io/provisioned-by": "identity-handler",
-            }
+    Projects are provisioned concurrently, with the blocking Kubernetes calls run in threads.
 
-            # Create PVC
-            result = ensure_workspace_pvc(
-                namespace=namespace,
-                pvc_name=pvc_name,
-                size=size,
-                storage_class=storage_class,
-                labels=labels,
-            )
+    Args:
+        username: username
+        projects: Set/list of project names
+        user_uid: k8s metadata.uid of the User CRD
+        project_cache: Optional dict of per-project storage resolution tasks by name,
+            shared across calls in one reconciliation so each project is resolved once
+        semaphore: Optional asyncio.Semaphore bounding concurrent provisioning
+        project_crds: Optional kopf index of Project CRDs (fetched from API if not provided)
+    """
+    if project_cache is None:
+        project_cache = {}
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(PVC_CONCURRENCY)
+
+    async def _one(project_name):
+        async with semaphore:
+            try:
+                if project_name not in project_cache:
+                    project_cache[project_name] = asyncio.ensure_future(
+                        asyncio.to_thread(_resolve_project_notebook_storage, project_name, project_crds)
+                    )
+                project_storage = await project_cache[project_name]
+                return await asyncio.to_thread(
+                    _ensure_project_notebook_pvc, username, project_name, project_storage, user_uid
+                )
+            except Exception as e:
+                logger.error(f"Failed to create notebook PVC for {username} in {project_name}: {e}")
+                return {"status": "error", "error": str(e)}
 
-            logger.info(f"Notebook PVC for {username} in {project_name}: {result['status']} ({pvc_name})")
-            results[project_name] = result
+    projects = list(projects)
+    results = await asyncio.gather(*(_one(project_name) for project_name in projects))
+    return dict(zip(projects, results))
 
-        except ApiException as e:
-            logger.error(f"Failed to create notebook PVC for {username} in {project_name}: {e}")
-            results[project_name] = {"status": "error", "error": str(e)}
-        except Exception as e:
-            logger.error(f"Failed to create notebook PVC for {username} in {project_name}: {e}")
-            results[project_name] = {"status": "error", "error": str(e)}
 
-    return results
+def _cleanup_project_notebook_pvcs(username, project_name):
+    """Delete a user's notebook PVCs in one project.
+
+    Args:
+        username: username
+        project_name: project name
+    """
+    core_api = kubernetes.client.CoreV1Api(get_api_client())
+    namespace = get_proj_namespace(project_name)
+    pvcs = core_api.list_namespaced_persistent_volume_claim(
+        namespace=namespace,
+        label_selector=(
+            f"karectl.io/user={username},"
+            f"karectl.io/project={project_name},"
+            f"karectl.io/workspace-type=notebook"
+        ),
+    )
+    if not pvcs.items:
+        logger.info(f"No notebook PVC found for {username} in {project_name}")
+        return {"status": "not_found"}
+
+    for pvc in pvcs.items:
+        result = delete_workspace_pvc(namespace, pvc.metadata.name)
+        logger.info(f"Notebook PVC cleanup for {username} in {project_name}: {result['status']}")
+    return result
 
 
-def cleanup_user_notebook_pvcs(username, projects):
+async def cleanup_user_notebook_pvcs(username, projects, semaphore=None):
     """Delete notebook PVCs for a user on removing from projects.
 
+    Projects are cleaned up concurrently, with the blocking Kubernetes calls run in threads.
+
     Args:
         username: username
         projects: Set/list of project names to remove PVCs
+        semaphore: Optional asyncio.Semaphore bounding concurrent cleanups
     """
-    results = {}
-    core_api = kubernetes.client.CoreV1Api()
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(PVC_CONCURRENCY)
 
-    for project_name in projects:
-        try:
-            namespace = get_proj_namespace(project_name)
-            pvcs = core_api.list_namespaced_persistent_volume_claim(
-                namespace=namespace,
-                label_selector=(
-                    f"karectl.io/user={username},"
-                    f"karectl.io/project={project_name},"
-                    f"karectl.io/workspace-type=notebook"
-                ),
-            )
-            if not pvcs.items:
-                logger.info(f"No notebook PVC found for {username} in {project_name}")
-                results[project_name] = {"status": "not_found"}
-                continue
-
-            for pvc in pvcs.items:
-                result = delete_workspace_pvc(namespace, pvc.metadata.name)
-                logger.info(f"Notebook PVC cleanup for {username} in {project_name}: {result['status']}")
-            results[project_name] = result
+    async def _one(project_name):
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(_cleanup_project_notebook_pvcs, username, project_name)
+            except Exception as e:
+                logger.error(f"Failed to cleanup notebook PVC for {username} in {project_name}: {e}")
+                return {"status": "error", "error": str(e)}
 
-        except Exception as e:
-            logger.error(f"Failed to cleanup notebook PVC for {username} in {project_name}: {e}")
-            results[project_name] = {"status": "error", "error": str(e)}
-
-    return results
+    projects = list(projects)
+    results = await asyncio.gather(*(_one(project_name) for project_name in projects))
+    return dict(zip(projects, results))
 
 # https://www.reddit.com/r/kubernetes/comments/1dge5qk/writing_an_operator_with_kopf/
 # Note: Startup configuration is now handled in main.py to avoid conflicts
 
 
 @kopf.on.create("identity.karectl.io", "v1alpha1", "user")
-@kopf.on.update("identity.karectl.io", "v1alpha1", "user")
+@kopf.on.update("identity.karectl.io", "v1alpha1", "user", field="spec")
 @kopf.on.resume("identity.karectl.io", "v1alpha1", "user")
-def user_create_update(body, spec, meta, status, patch, **kwargs):
+async def user_create_update(body, spec, meta, status, patch, **kwargs):
     """ Operator function for creating and updating users.
         Provision notebook PVCs for the projects the user has access to.
     """
     username = spec["username"]
-    ensure_realm_exists()
-    result = sync_keycloak_user(username, spec)
+    if _spec_unchanged(kwargs.get("reason"), spec, meta):
+        logger.debug(f"User {username} spec unchanged since last sync, skipping")
+        return
+
+    await _keycloak_call(_ensure_realm_once)
+    result = await _keycloak_call(sync_keycloak_user, username, spec)
 
     if result and "password" in result:
         patch.status["initialPassword"] = result["password"]
 
-    kopf.info(meta, reason="UserSynced", message=f"User {username} synced.")
+    # One event per reconcile, with storage details appended when provisioned
+    synced_message = f"User {username} synced."
 
     # Provision notebook PVCs for user's projects.
     # meta["uid"] is the User CRD's UID used to uniquely identify
     # the user across project group membership changes.
     user_uid = meta["uid"]
-    projects = get_user_projects(username)
+    projects = get_user_projects(username, kwargs.get("group_projects_by_member"))
+    errors = []
 
     if projects:
         logger.info(f"Provisioning notebook storage for {username} in {len(projects)} projects: {projects}")
-        pvc_results = ensure_user_notebook_pvc(username, projects, user_uid)
+        pvc_results = await ensure_user_notebook_pvc(
+            username, projects, user_uid, project_crds=kwargs.get("project_crds")
+        )
 
         # Track storage and status
-        provisioned = [pvc for pvc, reason in pvc_results.items() if reason.get("status") in ("created", "exists")]
-        skipped = [pvc for pvc, reason in pvc_results.items() if reason.get("status") == "skipped"]
-        errors = [pvc for pvc, reason in pvc_results.items() if reason.get("status") == "error"]
+        provisioned, skipped = [], []
+        for project_name, result in pvc_results.items():
+            pvc_status = result.get("status")
+            if pvc_status in ("created", "exists"):
+                provisioned.append(project_name)
+            elif pvc_status == "skipped":
+                skipped.append(project_name)
+            elif pvc_status == "error":
+                errors.append(project_name)
 
         patch.status["notebookStorage"] = {
             "provisioned": provisioned,
@@ -271,11 +506,7 @@ def user_create_update(body, spec, meta, status, patch, **kwargs):
         }
 
         if provisioned:
-            kopf.info(
-                meta,
-                reason="StorageProvisioned",
-                message=f"Notebook storage provisioned for {username} in projects: {', '.join(provisioned)}",
-            )
+            synced_message += f" Notebook storage provisioned in projects: {', '.join(provisioned)}."
         if errors:
             kopf.warn(
                 meta,
@@ -285,19 +516,24 @@ def user_create_update(body, spec, meta, status, patch, **kwargs):
     else:
         logger.info(f"No project group memberships found for {username}, skipping storage provisioning")
 
+    _record_spec_hash(patch, spec, succeeded=not errors)
+    kopf.info(meta, reason="UserSynced", message=synced_message)
+
 
 @kopf.on.delete("identity.karectl.io", "v1alpha1", "user")
-def user_delete(body, spec, meta, **kwargs):
+async def user_delete(body, spec, meta, **kwargs):
     """ Operator function for deleting users.
 
         PVCs are cleaned up when Project is deleted (namespace cascading deletion)
     """
     username = spec["username"]
 
-    delete_keycloak_user(username)
+    await _keycloak_call(delete_keycloak_user, username)
 
-    # Update which PVCs will be retained
-    projects = get_user_projects(username)
+    # Update which PVCs will be retained. Only used for logging, so it is read from
+    # the index and never falls back to listing Group CRDs.
+    group_projects = kwargs.get("group_projects_by_member")
+    projects = get_user_projects(username, group_projects) if group_projects is not None else set()
     if projects:
         logger.info(
             f"User {username} deleted. Notebook PVCs retained in projects: {projects}. "
@@ -308,50 +544,68 @@ def user_delete(body, spec, meta, **kwargs):
 
 
 @kopf.on.create("identity.karectl.io", "v1alpha1", "group")
-@kopf.on.update("identity.karectl.io", "v1alpha1", "group")
-def group_create_update(body, spec, meta, patch, **kwargs):
+@kopf.on.update("identity.karectl.io", "v1alpha1", "group", field="spec")
+async def group_create_update(body, spec, meta, patch, **kwargs):
     """ Operator function for creating and updating groups.
 
         Provisions notebook PVCs for group members when projects are configured.
     """
     groupname = meta["name"]
     projects = spec.get("projects", [])
+    if _spec_unchanged(kwargs.get("reason"), spec, meta):
+        logger.debug(f"Group {groupname} spec unchanged since last sync, skipping")
+        return
 
-    ensure_realm_exists()
-    sync_keycloak_group(groupname, spec)
-    kopf.info(meta, reason="GroupSynced", message=f"Group {groupname} synced.")
+    await _keycloak_call(_ensure_realm_once)
+    await _keycloak_call(sync_keycloak_group, groupname, spec)
+    # One event per reconcile, with storage details appended when provisioned
+    synced_message = f"Group {groupname} synced."
+    total_errors = 0
 
     # Provision notebook storage for all members in all projects
     if projects:
-        members = get_group_members(groupname)
+        members = await asyncio.to_thread(
+            get_group_members, groupname, spec, kwargs.get("usernames_by_group")
+        )
 
         if members:
             logger.info(f"Provisioning notebook storage for {len(members)} members of {groupname} in projects: {projects}")
 
-            all_results = {}
-            for username in members:
+            # Project storage config is shared by all members, so resolve each project once.
+            # Members are provisioned concurrently under one bound for the whole group.
+            project_cache = {}
+            semaphore = asyncio.Semaphore(PVC_CONCURRENCY)
+
+            async def _member(username):
                 try:
-                    user_uid = _get_user_uid(username)
+                    async with semaphore:
+                        user_uid = await asyncio.to_thread(_get_user_uid, username, kwargs.get("user_uids"))
                 except ApiException as e:
                     if e.status == 404:
                         logger.warning(f"User CRD not found for {username}, skipping PVC provisioning")
-                        all_results[username] = {}
-                        continue
+                        return {}
                     raise
-                pvc_results = ensure_user_notebook_pvc(username, projects, user_uid)
-                all_results[username] = pvc_results
+                return await ensure_user_notebook_pvc(
+                    username,
+                    projects,
+                    user_uid,
+                    project_cache=project_cache,
+                    semaphore=semaphore,
+                    project_crds=kwargs.get("project_crds"),
+                )
+
+            member_results = await asyncio.gather(*(_member(username) for username in members))
+            all_results = dict(zip(members, member_results))
 
             # Summarise results
-            total_provisioned = sum(
-                1 for user_results in all_results.values()
-                for result in user_results.values()
-                if result.get("status") in ("created", "exists")
-            )
-            total_errors = sum(
-                1 for user_results in all_results.values()
-                for result in user_results.values()
-                if result.get("status") == "error"
-            )
+            total_provisioned = 0
+            for user_results in all_results.values():
+                for result in user_results.values():
+                    pvc_status = result.get("status")
+                    if pvc_status in ("created", "exists"):
+                        total_provisioned += 1
+                    elif pvc_status == "error":
+                        total_errors += 1
 
             patch.status["storageProvisioning"] = {
                 "members": len(members),
@@ -361,11 +615,7 @@ def group_create_update(body, spec, meta, patch, **kwargs):
             }
 
             if total_provisioned > 0:
-                kopf.info(
-                    meta,
-                    reason="StorageProvisioned",
-                    message=f"Provisioned {total_provisioned} notebook PVCs for group {groupname} members",
-                )
+                synced_message += f" Provisioned {total_provisioned} notebook PVCs for group members."
             if total_errors > 0:
                 kopf.warn(
                     meta,
@@ -377,57 +627,63 @@ def group_create_update(body, spec, meta, patch, **kwargs):
     else:
         logger.info(f"Group {groupname} has no projects configured")
 
+    _record_spec_hash(patch, spec, succeeded=total_errors == 0)
+    kopf.info(meta, reason="GroupSynced", message=synced_message)
+
 
 @kopf.on.delete("identity.karectl.io", "v1alpha1", "group")
-def group_delete(body, spec, meta, **kwargs):
+async def group_delete(body, spec, meta, **kwargs):
     """Operator function for deleting groups."""
     groupname = meta["name"]
-    delete_keycloak_group(groupname)
+    await _keycloak_call(delete_keycloak_group, groupname)
     kopf.info(meta, reason="GroupDeleted", message=f"Group {groupname} deleted.")
 
 
 @kopf.on.create("identity.karectl.io", "v1alpha1", "keycloakclient")
-@kopf.on.update("identity.karectl.io", "v1alpha1", "keycloakclient")
+@kopf.on.update("identity.karectl.io", "v1alpha1", "keycloakclient", field="spec")
 @kopf.on.resume("identity.karectl.io", "v1alpha1", "keycloakclient")
-def client_create_update(body, spec, meta, **kwargs):
+async def client_create_update(body, spec, meta, **kwargs):
     """Handle KeycloakClient create, update, and resume (on operator restart).
     """
     client_id = spec.get("client_id") or spec.get("clientId")
     namespace = meta.get("namespace", "keycloak")
-    sync_keycloak_client(client_id, spec, namespace=namespace)
+    await _keycloak_call(sync_keycloak_client, client_id, spec, namespace=namespace)
     kopf.info(
         meta, reason="ClientSynced", message=f"Keycloak client {client_id} synced."
     )
 
 
 @kopf.on.delete("identity.karectl.io", "v1alpha1", "keycloakclient")
-def client_delete(body, spec, meta, **kwargs):
+async def client_delete(body, spec, meta, **kwargs):
     client_id = spec.get("client_id") or spec.get("clientId")
-    delete_keycloak_client(client_id)
+    await _keycloak_call(delete_keycloak_client, client_id)
     kopf.info(
         meta, reason="ClientDeleted", message=f"Keycloak client {client_id} deleted."
     )
 
 @kopf.on.create("research.karectl.io", "v1alpha1", "project")
-@kopf.on.update("research.karectl.io", "v1alpha1", "project")
+@kopf.on.update("research.karectl.io", "v1alpha1", "project", field="spec")
 @kopf.on.resume("research.karectl.io", "v1alpha1", "project")
-def project_create_update(body, spec, meta, patch, **kwargs):
+async def project_create_update(body, spec, meta, patch, **kwargs):
     """ Handle Project resource creation and updates.
         Creates/updates: Project namespace, resource quota, limitRange, jupyterHub hub role binding and cilium network policy
         for namespace isolation.
     """
     project_name = meta["name"]
+    if _spec_unchanged(kwargs.get("reason"), spec, meta):
+        logger.debug(f"Project {project_name} spec unchanged since last sync, skipping")
+        return
+
     description = spec.get("description", "")
     resources = spec.get("resources", [])
+    # Sub-resource outcomes are reported in one ProjectSynced event; failures warn individually
+    ready = []
 
     # Create/update project namespace
     try:
-        ns_result = ensure_proj_namespace(project_name, description)
-        kopf.info(
-            meta,
-            reason="NamespaceReady",
-            message=f"Namespace {ns_result['status']}: {ns_result['namespace']}",
-        )
+        ns_result = await asyncio.to_thread(ensure_proj_namespace, project_name, description)
+        ns_name = ns_result["namespace"]
+        ready.append(f"Namespace {ns_result['status']}: {ns_name}")
     except Exception as e:
         kopf.warn(
             meta,
@@ -436,112 +692,81 @@ def project_create_update(body, spec, meta, patch, **kwargs):
         )
         raise
 
-    # ResourceQuota
-    try:
-        quota_spec = spec.get("resource_quota") or {}
-        quota_result = ensure_resource_quota(project_name, quota_spec)
-        kopf.info(
-            meta,
-            reason="QuotaReady",
-            message=f"ResourceQuota {quota_result['status']}: {quota_result['name']}",
-        )
-    except Exception as e:
-        kopf.warn(
-            meta,
-            reason="QuotaFailed",
-            message=f"Failed to ensure quota for {project_name}: {e}",
-        )
+    # The remaining sub-resources only depend on the namespace, so ensure them concurrently
+    def _quota():
+        quota_result = ensure_resource_quota(project_name, spec.get("resource_quota") or {})
+        return f"ResourceQuota {quota_result['status']}: {quota_result['name']}"
 
-    # LimitRange
-    try:
-        limit_spec = spec.get("limit_range") or {}
-        lr_result = ensure_limit_range(project_name, limit_spec)
-        kopf.info(
-            meta,
-            reason="LimitRangeReady",
-            message=f"LimitRange {lr_result['status']}: {lr_result['name']}",
-        )
-    except Exception as e:
-        kopf.warn(
-            meta,
-            reason="LimitRangeFailed",
-            message=f"Failed to ensure limit range for {project_name}: {e}",
-        )
+    def _limit_range():
+        lr_result = ensure_limit_range(project_name, spec.get("limit_range") or {})
+        return f"LimitRange {lr_result['status']}: {lr_result['name']}"
 
-    # JupyterHub hub service account RoleBinding
-    try:
+    def _rolebind():
+        # JupyterHub hub service account RoleBinding
         rb_result = ensure_jupyter_rolebind(project_name)
-        kopf.info(
-            meta,
-            reason="RoleBindingReady",
-            message=f"Hub RoleBinding {rb_result['status']}: {rb_result['name']}",
-        )
-    except Exception as e:
-        kopf.warn(
-            meta,
-            reason="RoleBindingFailed",
-            message=f"Failed to ensure RoleBinding for {project_name}: {e}",
-        )
+        return f"Hub RoleBinding {rb_result['status']}: {rb_result['name']}"
 
-    # CiliumNetworkPolicy in the project namespace
-    try:
-        ns_name = get_proj_namespace(project_name)
+    def _network_policy():
+        # CiliumNetworkPolicy in the project namespace
         policy_result = create_project_network_policy(project_name, namespace=ns_name)
-        kopf.info(
-            meta,
-            reason="NetworkPolicyCreated",
-            message=f"Network policy {policy_result['status']}: {policy_result['name']}",
+        return f"Network policy {policy_result['status']}: {policy_result['name']}"
+
+    def _storage(workspace_type):
+        # Project-level shared and read-only storage
+        size, storage_class = resolve_project_storage_config(project_name, workspace_type, spec)
+        if not size:
+            logger.info(f"No {workspace_type} storage configured for project {project_name}, skipping")
+            return None
+        result = ensure_project_pvc(
+            namespace=ns_name,
+            project_uid=meta["uid"],
+            project_name=project_name,
+            workspace_type=workspace_type,
+            size=size,
+            storage_class=storage_class,
         )
-    except Exception as e:
-        kopf.warn(
-            meta,
-            reason="NetworkPolicyFailed",
-            message=f"Failed to create network policy for {project_name}: {e}",
-        )
-
-    # Project-level shared and read-only storage
-    project_uid = meta["uid"]
-    proj_namespace = get_proj_namespace(project_name)
+        return f"Project {workspace_type} storage {result['status']}: {result['name']}"
+
+    steps = [
+        ("QuotaFailed", f"Failed to ensure quota for {project_name}", _quota),
+        ("LimitRangeFailed", f"Failed to ensure limit range for {project_name}", _limit_range),
+        ("RoleBindingFailed", f"Failed to ensure RoleBinding for {project_name}", _rolebind),
+        ("NetworkPolicyFailed", f"Failed to create network policy for {project_name}", _network_policy),
+    ]
     for workspace_type in ("shared", "readonly"):
-        try:
-            size, storage_class = resolve_project_storage_config(project_name, workspace_type, spec)
-            if size:
-                result = ensure_project_pvc(
-                    namespace=proj_namespace,
-                    project_uid=project_uid,
-                    project_name=project_name,
-                    workspace_type=workspace_type,
-                    size=size,
-                    storage_class=storage_class,
-                )
-                kopf.info(
-                    meta,
-                    reason=f"{workspace_type.capitalize()}StorageReady",
-                    message=f"Project {workspace_type} storage {result['status']}: {result['name']}",
-                )
-            else:
-                logger.info(f"No {workspace_type} storage configured for project {project_name}, skipping")
-        except Exception as e:
-            kopf.warn(
-                meta,
-                reason=f"{workspace_type.capitalize()}StorageFailed",
-                message=f"Failed to ensure {workspace_type} storage for {project_name}: {e}",
-            )
-
-    patch.status["namespace"] = get_proj_namespace(project_name)
+        steps.append((
+            f"{workspace_type.capitalize()}StorageFailed",
+            f"Failed to ensure {workspace_type} storage for {project_name}",
+            functools.partial(_storage, workspace_type),
+        ))
+
+    results = await asyncio.gather(
+        *(asyncio.to_thread(step) for _, _, step in steps), return_exceptions=True
+    )
+    failed = False
+    for (reason, failure, _), result in zip(steps, results):
+        if isinstance(result, Exception):
+            failed = True
+            kopf.warn(meta, reason=reason, message=f"{failure}: {result}")
+        elif result:
+            ready.append(result)
+
+    patch.status["namespace"] = ns_name
+    _record_spec_hash(patch, spec, succeeded=not failed)
     kopf.info(
         meta,
         reason="ProjectSynced",
         message=(
             f"Project {project_name} synced to namespace "
-            f"{get_proj_namespace(project_name)} "
-            f"({len(resources)} resources)"
+            f"{ns_name} "
+            f"({len(resources)} resources). "
+            f"{'; '.join(ready)}"
         ),
     )
 
 
 @kopf.on.delete("research.karectl.io", "v1alpha1", "project")
-def project_delete(body, spec, meta, **kwargs):
+async def project_delete(body, spec, meta, **kwargs):
     """ Handle Project resource deletion.
 
     Deletes the project namespace with cascading deletion. Automatically removes all
@@ -549,7 +774,7 @@ def project_delete(body, spec, meta, **kwargs):
     """
     project_name = meta["name"]
     try:
-        ns_result = del_proj_namespace(project_name)
+        ns_result = await asyncio.to_thread(del_proj_namespace, project_name)
         kopf.info(
             meta,
             reason="NamespaceDeleted",
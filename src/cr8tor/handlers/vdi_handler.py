@@ -1,7 +1,10 @@
 """VDI Handler for managing VDIInstance custom resources using Kopf."""
 
+import json
 import logging
 import os
+import threading
+import time
 
 import kopf
 import kubernetes
@@ -10,6 +13,13 @@ import datetime
 import yaml
 import jinja2
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from cr8tor.services.kube_client import get_api_client
 from cr8tor.services.storage_manager import (
     resolve_vdi_storage_config,
     resolve_scheduling_config,
@@ -51,52 +61,79 @@ patch_kopf_filter()
 # Note: Startup configuration is now handled in main.py to avoid conflicts
 # kubernetes.config is loaded in main.py
 
+# Field manager for server-side apply of VDI resources
+FIELD_MANAGER = "cr8tor-vdi"
+APPLY_PATCH_CONTENT_TYPE = "application/apply-patch+yaml"
+
+# Seconds the source vdi-init-scripts data is reused before it is read again
+INIT_SCRIPTS_CACHE_TTL = int(os.environ.get("INIT_SCRIPTS_CACHE_TTL", "300"))
+_init_scripts_cache = {"data": None, "read_at": None}
+_init_scripts_lock = threading.Lock()
+
+# Shared so the pod template is read and compiled once, then served from the
+# environment's template cache; templates are baked into the image, so no reload checks
+TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader("/app/templates"),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
+
+
+def _get_init_scripts_data(api):
+    """ Get the data of the source vdi-init-scripts ConfigMap, cached for INIT_SCRIPTS_CACHE_TTL.
+    """
+    with _init_scripts_lock:
+        read_at = _init_scripts_cache["read_at"]
+        if read_at is not None and time.monotonic() - read_at < INIT_SCRIPTS_CACHE_TTL:
+            return _init_scripts_cache["data"]
+
+        # Read the source ConfigMap from cr8tor namespace. Only .data is needed, so the
+        # raw JSON is decoded directly rather than mapped onto a V1ConfigMap model.
+        try:
+            response = api.read_namespaced_config_map(
+                name="vdi-init-scripts", namespace="cr8tor", _preload_content=False
+            )
+        except ApiException as e:
+            print(f"Failed to read source vdi-init-scripts from cr8tor: {e}", flush=True)
+            raise
+
+        _init_scripts_cache["data"] = json.loads(response.data).get("data") or {}
+        _init_scripts_cache["read_at"] = time.monotonic()
+        return _init_scripts_cache["data"]
+
 
 def ensure_init_scripts_configmap(namespace):
     """ Ensure vdi-init-scripts exists in the target namespace.
     """
-    api = kubernetes.client.CoreV1Api()
-
-    # Read the source ConfigMap from cr8tor namespace
+    api = kubernetes.client.CoreV1Api(get_api_client())
+    data = _get_init_scripts_data(api)
+
+    # Server-side apply creates or updates the copy in one request
+    cm_body = {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {
+            "name": "vdi-init-scripts",
+            "namespace": namespace,
+            "labels": {"managed-by": "cr8tor-operator"},
+        },
+        "data": data,
+    }
     try:
-        source_cm = api.read_namespaced_config_map(name="vdi-init-scripts", namespace="cr8tor")
+        api.patch_namespaced_config_map(
+            name="vdi-init-scripts",
+            namespace=namespace,
+            body=cm_body,
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_PATCH_CONTENT_TYPE,
+        )
+        print(f"Applied vdi-init-scripts in {namespace}", flush=True)
     except ApiException as e:
-        print(f"Failed to read source vdi-init-scripts from cr8tor: {e}", flush=True)
+        print(f"Failed to apply vdi-init-scripts: {e}", flush=True)
         raise
 
-    # Check if ConfigMap exists in target namespace
-    try:
-        existing_cm = api.read_namespaced_config_map(name="vdi-init-scripts", namespace=namespace)
-
-        # Update if data is different
-        if existing_cm.data != source_cm.data:
-            existing_cm.data = source_cm.data
-            api.replace_namespaced_config_map(
-                name="vdi-init-scripts",
-                namespace=namespace,
-                body=existing_cm
-            )
-            print(f"Updated vdi-init-scripts in {namespace}", flush=True)
-        else:
-            print(f"vdi-init-scripts already up-to-date in {namespace}", flush=True)
-
-    except ApiException as e:
-        if e.status == 404:
-            # Create new ConfigMap
-            new_cm = kubernetes.client.V1ConfigMap(
-                metadata=kubernetes.client.V1ObjectMeta(
-                    name="vdi-init-scripts",
-                    namespace=namespace,
-                    labels={"managed-by": "cr8tor-operator"}
-                ),
-                data=source_cm.data
-            )
-            api.create_namespaced_config_map(namespace=namespace, body=new_cm)
-            print(f"Created vdi-init-scripts in {namespace}", flush=True)
-        else:
-            print(f"Failed to check/update vdi-init-scripts: {e}", flush=True)
-            raise
-
 
 def render_pod_template(
     name, namespace, user, project, image, connection, password, linux_user,
@@ -107,12 +144,7 @@ def render_pod_template(
     if scheduling is None:
         scheduling = {}
 
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader("/app/templates"),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-    template = env.get_template("vdi-pod-template.yaml.j2")
+    template = TEMPLATE_ENV.get_template("vdi-pod-template.yaml.j2")
     return template.render(
         name=name,
         namespace=namespace,
@@ -128,6 +160,18 @@ def render_pod_template(
     )
 
 
+def _service_exists(api, resource, namespace):
+    """ Check whether the Service for a rendered resource already exists.
+    """
+    try:
+        api.read_namespaced_service(name=resource["metadata"]["name"], namespace=namespace)
+        return True
+    except ApiException as e:
+        if e.status == 404:
+            return False
+        raise
+
+
 @kopf.on.create("karectl.io", "v1alpha1", "vdiinstances")
 def create_vdi(spec, name, namespace, patch, body, **kwargs):
     from secrets import token_urlsafe
@@ -177,17 +221,21 @@ def create_vdi(spec, name, namespace, patch, body, **kwargs):
     storage_size, storage_class, persist, pvc_enabled = resolve_vdi_storage_config(spec, project)
 
     if pvc_enabled:
-        identity_namespace = os.environ.get("IDENTITY_NAMESPACE", "keycloak")
-        custom_api = kubernetes.client.CustomObjectsApi()
-        user_obj = custom_api.get_namespaced_custom_object(
-            group="identity.karectl.io",
-            version="v1alpha1",
-            plural="users",
-            namespace=identity_namespace,
-            name=user,
-        )
-        user_uid = user_obj["metadata"]["uid"]
-        project_uid = get_project_uid(project)
+        # Read UIDs from the identity handler's kopf indexes, falling back to the API on a miss
+        user_uid = next(iter((kwargs.get("user_uids") or {}).get(user, [])), None)
+        if user_uid is None:
+            identity_namespace = os.environ.get("IDENTITY_NAMESPACE", "keycloak")
+            custom_api = kubernetes.client.CustomObjectsApi(get_api_client())
+            user_obj = custom_api.get_namespaced_custom_object(
+                group="identity.karectl.io",
+                version="v1alpha1",
+                plural="users",
+                namespace=identity_namespace,
+                name=user,
+            )
+            user_uid = user_obj["metadata"]["uid"]
+        project_crd = next(iter((kwargs.get("project_crds") or {}).get(project, [])), None)
+        project_uid = project_crd["metadata"]["uid"] if project_crd else get_project_uid(project)
         pvc_name = get_pvc_name("vdi", user_uid, project_uid)
         print(f"Storage enabled: size={storage_size}, class={storage_class}, persist={persist}", flush=True)
 
@@ -219,8 +267,8 @@ def create_vdi(spec, name, namespace, patch, body, **kwargs):
         name, namespace, user, project, image, connection, generated_password, linux_user, env_vars, pvc_name, scheduling
     )
 
-    resources = list(yaml.safe_load_all(pod_yaml))
-    api = kubernetes.client.CoreV1Api()
+    resources = list(yaml.load_all(pod_yaml, Loader=SafeLoader))
+    api = kubernetes.client.CoreV1Api(get_api_client())
 
     owner_ref = {
         "apiVersion": "karectl.io/v1alpha1",
@@ -239,24 +287,47 @@ def create_vdi(spec, name, namespace, patch, body, **kwargs):
             owner_ref
         )
 
-        try:
-            if resource["kind"] == "Pod":
+        if resource["kind"] == "Pod":
+            # Pod specs are immutable, so create it and leave an existing one (e.g. from a retried create) alone
+            try:
                 api.create_namespaced_pod(namespace=namespace, body=resource)
                 print(f"Created VDI pod: vdi-{name}", flush=True)
                 created_resources.append(f"Pod:vdi-{name}")
-            elif resource["kind"] == "Service":
-                api.create_namespaced_service(namespace=namespace, body=resource)
-                print(f"Created VDI service: vdi-{user}-{project}", flush=True)
-                created_resources.append(f"Service:vdi-{user}-{project}")
-        except ApiException as e:
-            if e.status == 409:
-                print(
-                    f"Resource already exists: {resource['kind']} {resource['metadata']['name']}",
-                    flush=True,
+            except ApiException as e:
+                if e.status != 409:
+                    print(f"Failed to create Pod: {e}", flush=True)
+                    raise
+                print(f"Resource already exists: Pod {resource['metadata']['name']}", flush=True)
+        elif resource["kind"] == "Service":
+            # Not forced: the Service is shared per user and project, so fields or a controller
+            # ownerReference set by another VDI instance must not be taken over
+            try:
+                api.patch_namespaced_service(
+                    name=resource["metadata"]["name"],
+                    namespace=namespace,
+                    body=resource,
+                    field_manager=FIELD_MANAGER,
+                    _content_type=APPLY_PATCH_CONTENT_TYPE,
                 )
-            else:
-                print(f"Failed to create {resource['kind']}: {e}", flush=True)
-                raise
+                print(f"Applied VDI service: vdi-{user}-{project}", flush=True)
+                created_resources.append(f"Service:vdi-{user}-{project}")
+            except ApiException as e:
+                if e.status == 409:
+                    # Apply conflict: another field manager owns fields of the existing Service
+                    print(
+                        f"Service {resource['metadata']['name']} is managed by another instance, leaving it as is",
+                        flush=True,
+                    )
+                elif e.status == 422:
+                    # Rejected, e.g. because another instance holds the controller ownerReference.
+                    # Only skip it if the Service really exists; this is an extra GET.
+                    if not _service_exists(api, resource, namespace):
+                        print(f"Failed to apply Service: {e}", flush=True)
+                        raise
+                    print(f"Resource already exists: Service {resource['metadata']['name']}", flush=True)
+                else:
+                    print(f"Failed to apply Service: {e}", flush=True)
+                    raise
 
     patch.status["phase"] = "Running"
     print(
@@ -274,7 +345,7 @@ def delete_vdi(spec, name, namespace, patch, body, **kwargs):
     pod_name = f"vdi-{name}"
     service_name = f"vdi-{user}-{project}"
 
-    api = kubernetes.client.CoreV1Api()
+    api = kubernetes.client.CoreV1Api(get_api_client())
 
     try:
         api.delete_namespaced_pod(name=pod_name, namespace=namespace)
@@ -320,7 +391,7 @@ def update_vdi(spec, name, namespace, patch, body, **kwargs):
     if old_env != new_env:
         print(f"Environment variables updated for VDI: {name}", flush=True)
 
-        api = kubernetes.client.CoreV1Api()
+        api = kubernetes.client.CoreV1Api(get_api_client())
         pod_name = f"vdi-{name}"
 
         try:
@@ -74,7 +74,12 @@ def startup_fn(settings: kopf.OperatorSettings, **kwargs):
     plugin_registry.register_all_handlers()
 
     # Configure operator settings
-    settings.batching.worker_limit = int(os.getenv("WORKER_LIMIT", "5"))
+    settings.batching.worker_limit = int(os.getenv("WORKER_LIMIT", "50"))
+    # Collect a burst of events for the same object into one handler run
+    settings.batching.batch_window = float(os.getenv("BATCH_WINDOW", "1.0"))
+    # Thread pool for sync handlers only; asyncio.to_thread in the async handlers runs on the
+    # event loop's default executor, with Keycloak calls capped by KEYCLOAK_CONCURRENCY
+    settings.execution.max_workers = int(os.getenv("MAX_WORKERS", "20"))
     settings.posting.enabled = os.getenv("POSTING_ENABLED", "false").lower() == "true"
     settings.watching.server_timeout = int(os.getenv("SERVER_TIMEOUT", "60"))
 
@@ -82,6 +87,7 @@ def startup_fn(settings: kopf.OperatorSettings, **kwargs):
     plugin_names = list(init_results.keys())
     logger.info(f"Initialised plugins: {plugin_names}")
     logger.info(f"Worker limit: {settings.batching.worker_limit}")
+    logger.info(f"Max executor workers: {settings.execution.max_workers}")
     logger.info(f"Posting enabled: {settings.posting.enabled}")
     logger.info("Cr8tor Operator startup complete")
 
@@ -1,5 +1,23 @@
+import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from keycloak import KeycloakAdmin
+from keycloak.exceptions import KeycloakGetError
+
+logger = logging.getLogger(__name__)
+
+# KeycloakAdmin instances by realm, reused so each one authenticates once and
+# refreshes its token in place instead of logging in on every call
+_admin_clients = {}
+_admin_clients_lock = threading.Lock()
+
+# Bounded pool for independent Keycloak calls fanned out within a single sync.
+# Tasks submitted here must not submit and wait on further tasks themselves.
+KEYCLOAK_SYNC_WORKERS = int(os.environ.get("KEYCLOAK_SYNC_WORKERS", "8"))
+sync_executor = ThreadPoolExecutor(
+    max_workers=KEYCLOAK_SYNC_WORKERS, thread_name_prefix="keycloak-sync"
+)
 
 
 def get_verify_tls():
@@ -8,33 +26,40 @@ def get_verify_tls():
     return verify_tls in ("true", "1", "yes")
 
 
+def _get_admin_client(realm_name):
+    """Get the cached KeycloakAdmin for a realm, authenticating against master."""
+    with _admin_clients_lock:
+        admin_client = _admin_clients.get(realm_name)
+        if admin_client is None:
+            admin_client = KeycloakAdmin(
+                server_url=os.environ.get("KEYCLOAK_URL", "http://keycloak.keycloak/"),
+                username=os.environ["KEYCLOAK_ADMIN"],
+                password=os.environ["KEYCLOAK_ADMIN_PASSWORD"],
+                realm_name=realm_name,
+                user_realm_name="master",
+                verify=get_verify_tls(),
+            )
+            _admin_clients[realm_name] = admin_client
+        return admin_client
+
+
 def get_client():
     """Get a Keycloak client."""
-    return KeycloakAdmin(
-        server_url=os.environ.get("KEYCLOAK_URL", "http://keycloak.keycloak/"),
-        username=os.environ["KEYCLOAK_ADMIN"],
-        password=os.environ["KEYCLOAK_ADMIN_PASSWORD"],
-        realm_name=os.environ.get("KEYCLOAK_REALM", "karectl-app"),
-        user_realm_name="master",
-        verify=get_verify_tls(),
-    )
+    return _get_admin_client(os.environ.get("KEYCLOAK_REALM", "karectl-app"))
 
 
 def ensure_realm_exists(realm_name=None, display_name=None):
     """Ensure a realm exists in Keycloak."""
     realm_name = realm_name or os.environ.get("KEYCLOAK_REALM", "karectl-app")
-    admin_client = KeycloakAdmin(
-        server_url=os.environ.get("KEYCLOAK_URL", "http://keycloak.keycloak/"),
-        username=os.environ["KEYCLOAK_ADMIN"],
-        password=os.environ["KEYCLOAK_ADMIN_PASSWORD"],
-        realm_name="master",
-        user_realm_name="master",
-        verify=get_verify_tls(),
-    )
-
-    realms = admin_client.get_realms()
-    if any(r["realm"] == realm_name for r in realms):
+    admin_client = _get_admin_client("master")
+
+    # Fetch only the one realm rather than every realm representation
+    try:
+        admin_client.get_realm(realm_name)
         return
+    except KeycloakGetError as e:
+        if e.response_code != 404:
+            raise
 
     payload = {
         "realm": realm_name,
@@ -48,4 +73,4 @@ def ensure_realm_exists(realm_name=None, display_name=None):
         "defaultRoles": ["offline_access", "uma_authorization", "user"],
     }
     admin_client.create_realm(payload=payload)
-    print(f"[Keycloak] Realm '{realm_name}' created.")
+    logger.info(f"Realm '{realm_name}' created.")
@@ -1,9 +1,15 @@
 import json
+import logging
 import os
 import re
 import base64
-from kubernetes import client, config
-from .client import get_client
+from concurrent.futures import wait
+from keycloak.exceptions import KeycloakPostError, raise_error_from_response
+from kubernetes import client
+from .client import get_client, sync_executor
+from .kube_client import get_api_client
+
+logger = logging.getLogger(__name__)
 
 
 def expand_env_vars(value):
@@ -15,25 +21,25 @@ def expand_env_vars(value):
         var_name = match.group(1)
         env_value = os.environ.get(var_name)
         if env_value is None:
-            print(f"Warning: Environment variable '{var_name}' not found, keeping placeholder")
+            logger.warning(f"Environment variable '{var_name}' not found, keeping placeholder")
             return match.group(0)  # Return original ${VAR_NAME} if not found
         return env_value
 
     return re.sub(r'\$\{([^}]+)\}', replacer, value)
 
 
-def assign_client_scopes(kc, client_uuid, scope_names, scope_type="default"):
+def assign_client_scopes(kc, client_uuid, scope_names, scope_type="default", available_scopes=None):
     """Assign client scopes to a client"""
-    available_scopes = kc.get_client_scopes()
+    if available_scopes is None:
+        available_scopes = kc.get_client_scopes()
+    scopes_by_name = {s["name"]: s for s in available_scopes}
     realm_name = kc.connection.realm_name
 
     success_count = 0
     failed_scopes = []
 
     for scope_name in scope_names:
-        scope_obj = next(
-            (s for s in available_scopes if s["name"] == scope_name), None
-        )
+        scope_obj = scopes_by_name.get(scope_name)
 
         if scope_obj:
             try:
@@ -46,27 +52,27 @@ def assign_client_scopes(kc, client_uuid, scope_names, scope_type="default"):
                     kc.add_client_default_client_scope(client_uuid, scope_obj["id"], payload)
                 else:
                     kc.add_client_optional_client_scope(client_uuid, scope_obj["id"], payload)
-                print(f"Assigned {scope_type} scope '{scope_name}' to client")
+                logger.debug(f"Assigned {scope_type} scope '{scope_name}' to client")
                 success_count += 1
             except Exception as scope_error:
-                print(f"Error assigning scope '{scope_name}': {scope_error}")
+                logger.error(f"Error assigning scope '{scope_name}': {scope_error}")
                 failed_scopes.append(scope_name)
         else:
-            print(f"Warning: Scope '{scope_name}' not found in realm")
+            logger.warning(f"Scope '{scope_name}' not found in realm")
             failed_scopes.append(scope_name)
 
-    print(f"Scope assignment complete: {success_count}/{len(scope_names)} successful")
+    logger.info(f"Scope assignment complete: {success_count}/{len(scope_names)} successful")
     if failed_scopes:
-        print(f"Failed scopes: {failed_scopes}")
+        logger.warning(f"Failed scopes: {failed_scopes}")
 
 
 def create_protocol_mappers(kc, client_uuid, mappers):
     """Create or update protocol mappers for a client"""
     if not mappers:
-        print("No protocol mappers to configure")
+        logger.debug("No protocol mappers to configure")
         return
 
-    print(f"Attempting to configure {len(mappers)} protocol mappers")
+    logger.debug(f"Attempting to configure {len(mappers)} protocol mappers")
     success_count = 0
     failed_mappers = []
 
@@ -75,9 +81,12 @@ def create_protocol_mappers(kc, client_uuid, mappers):
         existing_mappers = kc.get_mappers_from_client(client_uuid)
         existing_mapper_dict = {m["name"]: m for m in existing_mappers}
     except Exception as e:
-        print(f"Error getting existing mappers: {e}")
+        logger.error(f"Error getting existing mappers: {e}")
         existing_mapper_dict = {}
 
+    # Build every payload first, then replace existing mappers and create all of them
+    # with one add-models request instead of one POST per mapper
+    payloads = []
     for mapper in mappers:
         try:
             mapper_config = mapper.get("config", {})
@@ -90,50 +99,61 @@ def create_protocol_mappers(kc, client_uuid, mappers):
             protocol_mapper = mapper.get("protocol_mapper") or mapper.get("protocolMapper")
             if not protocol_mapper:
                 raise KeyError(f"protocol_mapper is required for mapper '{mapper.get('name', 'unknown')}'")
-            mapper_payload = {
+            payloads.append({
                 "name": mapper["name"],
                 "protocol": mapper.get("protocol", "openid-connect"),
                 "protocolMapper": protocol_mapper,
                 "consentRequired": mapper.get("consent_required", mapper.get("consentRequired", False)),
                 "config": config_str,
-            }
+            })
+        except Exception as e:
+            logger.error(f"Error configuring mapper '{mapper.get('name', 'unknown')}': {e}")
+            failed_mappers.append(mapper.get("name", "unknown"))
 
-            mapper_name = mapper["name"]
-            if mapper_name in existing_mapper_dict:
-                # Delete and recreate mapper
-                try:
-                    existing_mapper_id = existing_mapper_dict[mapper_name]["id"]
-                    kc.remove_client_mapper(client_uuid, existing_mapper_id)
-                    kc.add_mapper_to_client(client_uuid, mapper_payload)
-                    print(f"Recreated protocol mapper '{mapper_name}'")
-                    success_count += 1
-                except Exception as recreate_error:
-                    print(f"Error updating mapper '{mapper_name}': {recreate_error}")
-                    failed_mappers.append(mapper_name)
-            else:
-                # Create new mapper
+    to_add = []
+    for mapper_payload in payloads:
+        mapper_name = mapper_payload["name"]
+        if mapper_name in existing_mapper_dict:
+            # Delete so the mapper is recreated by the batch below
+            try:
+                kc.remove_client_mapper(client_uuid, existing_mapper_dict[mapper_name]["id"])
+            except Exception as remove_error:
+                logger.error(f"Error updating mapper '{mapper_name}': {remove_error}")
+                failed_mappers.append(mapper_name)
+                continue
+        to_add.append(mapper_payload)
+
+    if to_add:
+        try:
+            response = kc.connection.raw_post(
+                f"admin/realms/{kc.connection.realm_name}/clients/{client_uuid}/protocol-mappers/add-models",
+                data=json.dumps(to_add),
+            )
+            raise_error_from_response(response, KeycloakPostError, expected_codes=[204])
+            success_count += len(to_add)
+            logger.info(f"Created protocol mappers {[m['name'] for m in to_add]}")
+        except Exception as batch_error:
+            # Fall back to one request per mapper to find out which ones fail
+            logger.warning(f"Batch mapper creation failed, retrying individually: {batch_error}")
+            for mapper_payload in to_add:
                 try:
                     kc.add_mapper_to_client(client_uuid, mapper_payload)
-                    print(f"Created protocol mapper '{mapper_name}'")
+                    logger.debug(f"Created protocol mapper '{mapper_payload['name']}'")
                     success_count += 1
                 except Exception as create_error:
-                    print(f"Error creating mapper '{mapper_name}': {create_error}")
-                    failed_mappers.append(mapper_name)
+                    logger.error(f"Error creating mapper '{mapper_payload['name']}': {create_error}")
+                    failed_mappers.append(mapper_payload["name"])
 
-        except Exception as e:
-            print(f"Error configuring mapper '{mapper.get('name', 'unknown')}': {e}")
-            failed_mappers.append(mapper.get("name", "unknown"))
-
-    print(f"Protocol mapper configuration complete: {success_count}/{len(mappers)} successful")
+    logger.info(f"Protocol mapper configuration complete: {success_count}/{len(mappers)} successful")
     if failed_mappers:
-        print(f"Failed mappers: {failed_mappers}")
+        logger.warning(f"Failed mappers: {failed_mappers}")
 
 
 def sync_keycloak_client(client_id, spec, namespace=None):
     """ Sync a Keycloak client."""
     kc = get_client()
-    clients = kc.get_clients()
-    client_obj = next((c for c in clients if c["clientId"] == client_id), None)
+    # Keycloak filters clients by clientId server-side, so the realm's clients aren't all listed
+    client_uuid = kc.get_client_id(client_id)
 
     # Support both snake_case (LinkML) and camelCase (legacy) field names
     def get_field(snake, camel, default=None):
@@ -143,26 +163,26 @@ def sync_keycloak_client(client_id, spec, namespace=None):
     secret_ref = get_field("secret_ref", "secretRef")
     if secret_ref:
         try:
-            config.load_incluster_config()
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(get_api_client())
             secret_namespace = namespace or os.environ.get("KUBERNETES_NAMESPACE", "keycloak")
 
-            secret = v1.read_namespaced_secret(
-                name=secret_ref["name"], namespace=secret_namespace
+            # Only one key is needed, so decode the raw JSON rather than building a V1Secret model
+            response = v1.read_namespaced_secret(
+                name=secret_ref["name"], namespace=secret_namespace, _preload_content=False
             )
+            secret_data = json.loads(response.data).get("data") or {}
             secret_key = secret_ref.get("key", "client-secret")
-            secret_value = base64.b64decode(secret.data[secret_key]).decode("utf-8")
-            print(f"Retrieved secret for {client_id} from {secret_ref['name']} in namespace {secret_namespace}")
+            secret_value = base64.b64decode(secret_data[secret_key]).decode("utf-8")
 
         except Exception as e:
-            print(f"Error reading secretRef for {client_id}: {e}")
+            logger.error(f"Error reading secretRef for {client_id}: {e}")
             secret_value = spec.get("secret")
     elif "secret" in spec:
         secret_value = expand_env_vars(spec["secret"])
-        print(f"Expanded secret value for {client_id}")
+        logger.debug(f"Expanded secret value for {client_id}")
 
     if not secret_value:
-        print(f"No secret found for client {client_id}")
+        logger.warning(f"No secret found for client {client_id}")
         return
 
     payload = {
@@ -179,41 +199,58 @@ def sync_keycloak_client(client_id, spec, namespace=None):
     }
 
     try:
-        if client_obj:
-            kc.update_client(client_obj["id"], payload)
-            client_uuid = client_obj["id"]
-            print(f"Updated Keycloak client {client_id}")
+        if client_uuid:
+            # Only write when a field we manage differs, so unchanged reconciles don't touch Keycloak
+            existing = kc.get_client(client_uuid)
+            if any(existing.get(key) != value for key, value in payload.items()):
+                kc.update_client(client_uuid, payload)
+                logger.info(f"Updated Keycloak client {client_id}")
+            else:
+                logger.debug(f"Keycloak client {client_id} already up to date")
         else:
             client_uuid = kc.create_client(payload)
-            print(f"Created Keycloak client {client_id}")
+            logger.info(f"Created Keycloak client {client_id}")
 
-        # Handle client scope assignments
+        # Handle client scope assignments, listing the realm's scopes once for both kinds
         default_scopes = get_field("default_client_scopes", "defaultClientScopes")
+        optional_scopes = get_field("optional_client_scopes", "optionalClientScopes")
+        available_scopes = kc.get_client_scopes() if default_scopes or optional_scopes else []
+
+        # Scope assignments and protocol mappers don't depend on each other, so run them concurrently
+        futures = []
         if default_scopes:
-            assign_client_scopes(kc, client_uuid, default_scopes, scope_type="default")
+            futures.append(sync_executor.submit(
+                assign_client_scopes,
+                kc, client_uuid, default_scopes, scope_type="default", available_scopes=available_scopes
+            ))
 
-        optional_scopes = get_field("optional_client_scopes", "optionalClientScopes")
         if optional_scopes:
-            assign_client_scopes(kc, client_uuid, optional_scopes, scope_type="optional")
+            futures.append(sync_executor.submit(
+                assign_client_scopes,
+                kc, client_uuid, optional_scopes, scope_type="optional", available_scopes=available_scopes
+            ))
 
         # Handle protocol mappers
         mappers = get_field("protocol_mappers", "protocolMappers")
         if mappers:
-            create_protocol_mappers(kc, client_uuid, mappers)
+            futures.append(sync_executor.submit(create_protocol_mappers, kc, client_uuid, mappers))
+
+        wait(futures)
+        for future in futures:
+            future.result()
 
     except Exception as e:
-        print(f"Error syncing client {client_id}: {e}")
+        logger.error(f"Error syncing client {client_id}: {e}")
         raise
 
 
 def delete_keycloak_client(client_id):
     """Delete a client from keycloak."""
     kc = get_client()
-    clients = kc.get_clients()
-    client_obj = next((c for c in clients if c["clientId"] == client_id), None)
+    client_uuid = kc.get_client_id(client_id)
 
-    if client_obj:
-        kc.delete_client(client_obj["id"])
-        print(f"Deleted Keycloak client {client_id}")
+    if client_uuid:
+        kc.delete_client(client_uuid)
+        logger.info(f"Deleted Keycloak client {client_id}")
     else:
-        print(f"Client {client_id} not found for deletion")
+        logger.warning(f"Client {client_id} not found for deletion")
@@ -1,32 +1,67 @@
 import logging
+from concurrent.futures import wait
 
 from keycloak.exceptions import KeycloakGetError, KeycloakDeleteError, KeycloakPutError
-from .client import get_client
+from .client import get_client, sync_executor
 
 logger = logging.getLogger(__name__)
 
 
+def find_group(keycloak_client, groupname):
+    """Find a top-level Keycloak group by exact name.
+
+    Keycloak filters by the search term server-side, so only matching groups are returned
+    instead of every group in the realm.
+    """
+    groups = keycloak_client.get_groups(query={"search": groupname})
+    return next((group for group in groups if group["name"] == groupname), None)
+
+
+def _remove_group_member(keycloak_client, groupname, group_id, kc_member):
+    """Remove one member from a Keycloak group, logging rather than raising on failure."""
+    member_id = kc_member["id"]
+    try:
+        keycloak_client.group_user_remove(member_id, group_id)
+        logger.info(f"Removed {kc_member.get('username')} (user_id={member_id}) from {groupname} (group_id={group_id})")
+    except KeycloakDeleteError as e:
+        logger.warning(f"Could not remove {kc_member.get('username')} (user_id={member_id}) from {groupname} (group_id={group_id}): {e}")
+
+
+def _add_group_member(keycloak_client, groupname, group_id, username):
+    """Add one user to a Keycloak group, logging rather than raising on failure."""
+    try:
+        user_id = keycloak_client.get_user_id(username)
+        keycloak_client.group_user_add(user_id, group_id)
+    except KeycloakGetError as e:
+        logger.warning(f"Could not resolve user {username} for group {groupname} (group_id={group_id}): {e}")
+    except KeycloakPutError as e:
+        logger.warning(f"Could not add {username} to {groupname} (group_id={group_id}): {e}")
+
+
 def sync_keycloak_group(groupname, spec):
     """Sync a group to Keycloak."""
     keycloak_client = get_client()
     description = spec.get("description", "")
     members = spec.get("members", [])
-    groups = keycloak_client.get_groups()
-    group = [group for group in groups if group["name"] == groupname]
+    group = find_group(keycloak_client, groupname)
 
     attributes = {"description": [description]}
 
     if group:
-        group_id = group[0]["id"]
-        keycloak_client.update_group(
-            group_id=group_id, payload={"name": groupname, "attributes": attributes}
-        )
+        group_id = group["id"]
+        # Search results are brief representations without attributes, so compare against the full group
+        existing = keycloak_client.get_group(group_id)
+        if existing.get("name") != groupname or existing.get("attributes", {}).get("description") != attributes["description"]:
+            keycloak_client.update_group(
+                group_id=group_id, payload={"name": groupname, "attributes": attributes}
+            )
     else:
         group_id = keycloak_client.create_group(
             {"name": groupname, "attributes": attributes}
         )
 
-    desired_usernames = set(members)
+    # Keycloak stores usernames in lowercase, so compare case-insensitively
+    desired_usernames = {username.lower(): username for username in members}
 
     # Remove users no longer in spec (project access revocation).
     try:
@@ -35,23 +70,26 @@ def sync_keycloak_group(groupname, spec):
         logger.warning(f"Could not fetch current members of {groupname}: {e}")
         current_kc_members = []
 
-    for kc_member in current_kc_members:
-        if kc_member.get("username") not in desired_usernames:
-            member_id = kc_member["id"]
-            try:
-                keycloak_client.group_user_remove(member_id, group_id)
-                logger.info(f"Removed {kc_member.get('username')} (user_id={member_id}) from {groupname} (group_id={group_id})")
-            except KeycloakDeleteError as e:
-                logger.warning(f"Could not remove {kc_member.get('username')} (user_id={member_id}) from {groupname} (group_id={group_id}): {e}")
-
-    for username in members:
-        try:
-            user_id = keycloak_client.get_user_id(username)
-            keycloak_client.group_user_add(user_id, group_id)
-        except KeycloakGetError as e:
-            logger.warning(f"Could not resolve user {username} for group {groupname} (group_id={group_id}): {e}")
-        except KeycloakPutError as e:
-            logger.warning(f"Could not add {username} to {groupname} (group_id={group_id}): {e}")
+    # Membership changes are independent of each other, so fan them out over the shared pool.
+    # Removals finish before any addition starts, as in a sequential sync.
+    removals = [
+        sync_executor.submit(_remove_group_member, keycloak_client, groupname, group_id, kc_member)
+        for kc_member in current_kc_members
+        if (kc_member.get("username") or "").lower() not in desired_usernames
+    ]
+    wait(removals)
+    for future in removals:
+        future.result()
+
+    # Only add users that aren't members yet, rather than re-adding everyone
+    current_usernames = {(kc_member.get("username") or "").lower() for kc_member in current_kc_members}
+    additions = [
+        sync_executor.submit(_add_group_member, keycloak_client, groupname, group_id, desired_usernames[key])
+        for key in desired_usernames.keys() - current_usernames
+    ]
+    wait(additions)
+    for future in additions:
+        future.result()
 
     logger.info(f"Synced group {groupname}")
 
@@ -59,11 +97,10 @@ def sync_keycloak_group(groupname, spec):
 def delete_keycloak_group(groupname):
     """Delete a group from Keycloak."""
     keycloak_client = get_client()
-    groups = keycloak_client.get_groups()
-    group = [group for group in groups if group["name"] == groupname]
+    group = find_group(keycloak_client, groupname)
 
     if group:
-        keycloak_client.delete_group(group[0]["id"])
+        keycloak_client.delete_group(group["id"])
         logger.info(f"Deleted group {groupname}")
     else:
         logger.warning(f"Group {groupname} not found")
@@ -0,0 +1,32 @@
+""" Shared Kubernetes API client for the operator services and handlers.
+"""
+
+import functools
+import os
+
+import kubernetes
+from urllib3.util.retry import Retry
+
+# Connections kept alive per host; the default of 4 is too small for concurrent reconciles
+KUBE_CONNECTION_POOL_MAXSIZE = int(os.environ.get("KUBE_CONNECTION_POOL_MAXSIZE", "32"))
+
+
+@functools.lru_cache(maxsize=None)
+def get_api_client():
+    """ Get the process-wide Kubernetes ApiClient.
+
+    Created on first use so it picks up the configuration loaded at operator startup,
+    then reused so every API call shares one connection pool.
+    """
+    configuration = kubernetes.client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = KUBE_CONNECTION_POOL_MAXSIZE
+    # urllib3 only retries idempotent methods by default, so creates and patches are never repeated.
+    # raise_on_status=False returns the last response once retries run out, so callers still get
+    # ApiException with e.status rather than urllib3's MaxRetryError
+    configuration.retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    return kubernetes.client.ApiClient(configuration)
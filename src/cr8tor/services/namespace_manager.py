@@ -6,6 +6,8 @@ import logging
 import kubernetes
 from kubernetes.client.exceptions import ApiException
 
+from cr8tor.services.kube_client import get_api_client
+
 logger = logging.getLogger(__name__)
 
 PROJECT_NAMESPACE_PREFIX = "project-"
@@ -37,7 +39,7 @@ def ensure_proj_namespace(project_name, description="", labels=None):
         description: Project description
         labels: Additional labels to apply
     """
-    api = kubernetes.client.CoreV1Api()
+    api = kubernetes.client.CoreV1Api(get_api_client())
     ns_name = get_proj_namespace(project_name)
 
     ns_labels = {**STANDARD_LABELS, "karectl.io/project": project_name}
@@ -81,7 +83,7 @@ def ensure_resource_quota(project_name, quota_config=None):
         project_name: Project name
         quota_config: Dict with quota values
     """
-    api = kubernetes.client.CoreV1Api()
+    api = kubernetes.client.CoreV1Api(get_api_client())
     ns_name = get_proj_namespace(project_name)
     quota_name = f"{project_name}-quota"
 
@@ -139,7 +141,7 @@ def ensure_limit_range(project_name, limit_config=None):
         project_name: Project name
         limit_config: Dict with limit values
     """
-    api = kubernetes.client.CoreV1Api()
+    api = kubernetes.client.CoreV1Api(get_api_client())
     ns_name = get_proj_namespace(project_name)
     lr_name = f"{project_name}-limits"
 
@@ -196,7 +198,7 @@ def ensure_jupyter_rolebind(project_name):
     Args:
         project_name: Project name
     """
-    rbac_api = kubernetes.client.RbacAuthorizationV1Api()
+    rbac_api = kubernetes.client.RbacAuthorizationV1Api(get_api_client())
     ns_name = get_proj_namespace(project_name)
     name = "jupyterhub-hub-spawner"
 
@@ -284,7 +286,7 @@ def del_proj_namespace(project_name):
     Args:
         project_name: Project name
     """
-    api = kubernetes.client.CoreV1Api()
+    api = kubernetes.client.CoreV1Api(get_api_client())
     ns_name = get_proj_namespace(project_name)
 
     try:
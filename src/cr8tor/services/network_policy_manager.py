@@ -13,6 +13,8 @@ import kubernetes
 from kubernetes.client.exceptions import ApiException
 import yaml
 
+from cr8tor.services.kube_client import get_api_client
+
 logger = logging.getLogger(__name__)
 
 # CiliumNetworkPolicy template for project isolation
@@ -98,7 +100,7 @@ def create_project_network_policy(project_name, namespace):
     Returns:
         dict with status of the operation
     """
-    api = kubernetes.client.CustomObjectsApi()
+    api = kubernetes.client.CustomObjectsApi(get_api_client())
     policy_name = "project-isolation"
     policy_yaml = NAMESPACE_NETWORK_POLICY_TEMPLATE.format(
         project_name=project_name,
@@ -152,7 +154,7 @@ def delete_project_network_policy(project_name, namespace):
     Returns:
         dict with status of the operation
     """
-    api = kubernetes.client.CustomObjectsApi()
+    api = kubernetes.client.CustomObjectsApi(get_api_client())
     policy_name = "project-isolation"
 
     try:
@@ -7,6 +7,8 @@ import os
 import kubernetes
 from kubernetes.client.exceptions import ApiException
 
+from cr8tor.services.kube_client import get_api_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -93,7 +95,7 @@ def get_helm_storage_config():
 def _get_project_spec(project_name):
     """ Get the full Project CRD spec.
     """
-    api = kubernetes.client.CustomObjectsApi()
+    api = kubernetes.client.CustomObjectsApi(get_api_client())
     identity_namespace = os.environ.get("IDENTITY_NAMESPACE", "keycloak")
     try:
         project = api.get_namespaced_custom_object(
@@ -111,22 +113,30 @@ def _get_project_spec(project_name):
         raise
 
 
-def get_project_uid(project_name):
-    """ Get the k8s metadata.uid of a Project CRD.
+def get_project_crd(project_name):
+    """ Get a Project CRD.
 
     Args:
         project_name: project name (CRD resource name)
     """
-    api = kubernetes.client.CustomObjectsApi()
+    api = kubernetes.client.CustomObjectsApi(get_api_client())
     identity_namespace = os.environ.get("IDENTITY_NAMESPACE", "keycloak")
-    project = api.get_namespaced_custom_object(
+    return api.get_namespaced_custom_object(
         group="research.karectl.io",
         version="v1alpha1",
         plural="projects",
         namespace=identity_namespace,
         name=project_name,
     )
-    return project["metadata"]["uid"]
+
+
+def get_project_uid(project_name):
+    """ Get the k8s metadata.uid of a Project CRD.
+
+    Args:
+        project_name: project name (CRD resource name)
+    """
+    return get_project_crd(project_name)["metadata"]["uid"]
 
 
 def _get_resource_entry(spec, resource_type):
@@ -139,16 +149,18 @@ def _get_resource_entry(spec, resource_type):
 
 
 
-def resolve_notebook_storage_config(project_name, override_size=None, override_storage_class=None):
+def resolve_notebook_storage_config(project_name, override_size=None, override_storage_class=None, spec=None):
     """ Resolve storage config for notebooks.
 
     Args:
         project_name: Name of the project
         override_size: Optional size override from API request
         override_storage_class: Optional storage class override
+        spec: Optional pre-fetched Project CRD spec (fetched from API if not provided)
     """
     helm_config = get_helm_storage_config()
-    spec = _get_project_spec(project_name)
+    if spec is None:
+        spec = _get_project_spec(project_name)
     project_config = _get_resource_entry(spec, "Jupyter").get("storage") or spec.get("storage") or {}
 
     # Resolve storage class (Override > Project > Helm)
@@ -244,7 +256,7 @@ def _ensure_pvc(namespace, pvc_name, size, access_modes, labels, storage_class=N
         labels: labels: Optional labels dict
         storage_class: StorageClass name (None = use cluster default)
     """
-    api = kubernetes.client.CoreV1Api()
+    api = kubernetes.client.CoreV1Api(get_api_client())
 
     # Build PVC spec
     pvc_spec = kubernetes.client.V1PersistentVolumeClaimSpec(
@@ -303,7 +315,7 @@ def delete_workspace_pvc(namespace, pvc_name):
         namespace: Kubernetes namespace
         pvc_name: Name of the PVC
     """
-    api = kubernetes.client.CoreV1Api()
+    api = kubernetes.client.CoreV1Api(get_api_client())
 
     try:
         api.delete_namespaced_persistent_volume_claim(
@@ -327,7 +339,7 @@ def list_project_pvcs(namespace):
     Args:
         namespace: Project namespace
     """
-    api = kubernetes.client.CoreV1Api()
+    api = kubernetes.client.CoreV1Api(get_api_client())
 
     try:
         pvcs = api.list_namespaced_persistent_volume_claim(
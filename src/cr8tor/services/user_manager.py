@@ -1,7 +1,10 @@
+import logging
 from keycloak.exceptions import KeycloakGetError, KeycloakPutError, KeycloakDeleteError
 from .client import get_client
 from .utils import generate_temp_password, write_passwords
 
+logger = logging.getLogger(__name__)
+
 
 def sync_keycloak_user(username, spec):
     """Sync a user to Keycloak."""
@@ -30,7 +33,7 @@ def sync_keycloak_user(username, spec):
             keycloak_client.update_user(user_id, user_payload)
         except KeycloakPutError as err:
             if "User not found" in str(err):
-                print(f"[INFO] User {username} not found on update, creating instead.")
+                logger.info(f"User {username} not found on update, creating instead.")
                 user_id = keycloak_client.create_user(user_payload)
                 user_created = True
             else:
@@ -38,7 +41,7 @@ def sync_keycloak_user(username, spec):
 
     except KeycloakGetError:
         # If user does not exist, create them
-        print(f"[INFO] User {username} not found, creating.")
+        logger.info(f"User {username} not found, creating.")
         user_id = keycloak_client.create_user(user_payload)
         user_created = True
 
@@ -50,13 +53,13 @@ def sync_keycloak_user(username, spec):
         if password:
             keycloak_client.set_user_password(user_id, password, temporary=True)
             temp_password = password
-            print(f"[INFO] Set password for {username} from spec")
+            logger.info(f"Set password for {username} from spec")
         else:
             temp_password = generate_temp_password()
             keycloak_client.set_user_password(user_id, temp_password, temporary=True)
             write_passwords(username, temp_password)
 
-    print(f"[INFO] Synced user {username} to Keycloak")
+    logger.info(f"Synced user {username} to Keycloak")
 
     return {"password": temp_password} if temp_password else {}
 
@@ -67,11 +70,11 @@ def delete_keycloak_user(username):
     try:
         user_id = keycloak_client.get_user_id(username)
         keycloak_client.delete_user(user_id)
-        print(f"Deleted user {username}")
+        logger.info(f"Deleted user {username}")
     except (KeycloakGetError, KeycloakDeleteError) as err:
         if "User not found" in str(err):
-            print(f"User {username} already deleted. Treating as success.")
+            logger.info(f"User {username} already deleted. Treating as success.")
             return
         else:
-            print(f"Error deleting user {username}: {err}")
+            logger.error(f"Error deleting user {username}: {err}")
             raise
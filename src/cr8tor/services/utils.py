@@ -1,20 +1,34 @@
+import logging
 import os
-import string
 import secrets
 
+logger = logging.getLogger(__name__)
+
+# Special characters mixed into generated temporary passwords
+PASSWORD_SYMBOLS = "!@#$%^&*()"
+
 
 def generate_temp_password(length=16):
     """Generate a random temporary password for a user."""
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*()"
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    # One urandom read for the whole password instead of one secrets.choice per character,
+    # with a symbol swapped in at a random position to keep a special character in it
+    password = list(secrets.token_urlsafe(length)[:length])
+    password[secrets.randbelow(length)] = secrets.choice(PASSWORD_SYMBOLS)
+    return "".join(password)
 
 
 def write_passwords(username, temp_password, directory="/tmp/user-passwords"):
-    """Write the temporary password for a user to a file."""
-    os.makedirs(directory, exist_ok=True)
+    """Write the temporary password for a user to a file readable only by the operator."""
+    # Checked on every write so a directory removed since the last one is recreated
+    os.makedirs(directory, mode=0o700, exist_ok=True)
     file_path = os.path.join(directory, f"{username}.txt")
 
-    with open(file_path, "w") as f:
-        f.write(f"Temporary password for {username}: {temp_password}\n")
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        # The mode above only applies to new files, so tighten ones left by older versions too
+        os.fchmod(fd, 0o600)
+        os.write(fd, f"Temporary password for {username}: {temp_password}\n".encode())
+    finally:
+        os.close(fd)
 
-    print(f"[PasswordGenerator] Temp password for {username} written to {file_path}")
+    logger.info(f"Temp password for {username} written to {file_path}")